@@ -0,0 +1,148 @@
+"""Shared fixtures for the offline unit tests (no Bluetooth hardware needed)."""
+
+import asyncio
+from types import SimpleNamespace
+from typing import Callable, Dict, List, Optional, Tuple
+
+import pytest
+
+import src.bluetooth_client as bluetooth_client
+from src.bluetooth_client import ThingyBLEClient
+
+
+def _uuid(char) -> str:
+    """Normalize a characteristic object or UUID string to an uppercase UUID."""
+    return str(getattr(char, "uuid", char)).upper()
+
+
+class FakeBleakClient:
+    """In-memory stand-in for bleak's BleakClient."""
+
+    # Payload notified repeatedly for each subscribed characteristic UUID
+    payloads: Dict[str, bytes] = {}
+    # Values returned by read_gatt_char, keyed by characteristic UUID
+    gatt_reads: Dict[str, bytes] = {}
+    # Every instance created, in order
+    instances: List["FakeBleakClient"] = []
+
+    def __init__(self, address, disconnected_callback=None, services=None, **kwargs) -> None:
+        self.address = getattr(address, "address", address)
+        self.is_connected = False
+        self.services = SimpleNamespace(get_characteristic=lambda uuid: None, characteristics={})
+        self.writes: List[Tuple[str, bytes, Optional[bool]]] = []
+        self.handlers: Dict[str, Callable] = {}
+        self._disconnected_callback = disconnected_callback
+        FakeBleakClient.instances.append(self)
+
+    async def connect(self) -> bool:
+        self.is_connected = True
+        return True
+
+    async def disconnect(self) -> bool:
+        self.is_connected = False
+        return True
+
+    async def start_notify(self, char, handler) -> None:
+        uuid = _uuid(char)
+        self.handlers[uuid] = handler
+        asyncio.get_running_loop().create_task(self._feed(uuid))
+
+    async def stop_notify(self, char) -> None:
+        self.handlers.pop(_uuid(char), None)
+
+    async def read_gatt_char(self, char) -> bytearray:
+        return bytearray(FakeBleakClient.gatt_reads.get(_uuid(char), b"\x00"))
+
+    async def write_gatt_char(self, char, data, response=None) -> None:
+        self.writes.append((_uuid(char), bytes(data), response))
+
+    async def _feed(self, uuid: str) -> None:
+        """Notify the configured payload every few milliseconds while subscribed."""
+        while self.is_connected and uuid in self.handlers:
+            await asyncio.sleep(0.01)
+            payload = FakeBleakClient.payloads.get(uuid)
+            handler = self.handlers.get(uuid)
+            if payload is not None and handler is not None:
+                handler(None, bytearray(payload))
+
+    def notify(self, uuid: str, data: bytes) -> None:
+        """Deliver a single notification immediately."""
+        self.handlers[uuid](None, bytearray(data))
+
+    def drop(self) -> None:
+        """Simulate the device going out of range."""
+        self.is_connected = False
+        self.handlers.clear()
+        if self._disconnected_callback is not None:
+            self._disconnected_callback(self)
+
+    def writes_to(self, uuid: str) -> List[bytes]:
+        """Payloads written to a characteristic, in order."""
+        return [data for char, data, _ in self.writes if char == uuid]
+
+
+class FakeBleakScanner:
+    """In-memory stand-in for bleak's BleakScanner."""
+
+    # (device, advertisement data) pairs reported by every scan
+    advertisements: List[Tuple[object, object]] = []
+    # Number of upcoming start() calls that raise
+    failing_starts = 0
+    # Every instance created, in order
+    instances: List["FakeBleakScanner"] = []
+
+    def __init__(self, detection_callback=None, **kwargs) -> None:
+        self._callback = detection_callback
+        self.kwargs = kwargs
+        self.scanning = False
+        FakeBleakScanner.instances.append(self)
+
+    async def start(self) -> None:
+        # Like BlueZ, refuse a second discovery while one is running on the adapter
+        if any(scanner.scanning for scanner in FakeBleakScanner.instances):
+            raise OSError("org.bluez.Error.InProgress")
+        if FakeBleakScanner.failing_starts:
+            FakeBleakScanner.failing_starts -= 1
+            raise OSError("org.bluez.Error.InProgress")
+        self.scanning = True
+        for device, advertisement in FakeBleakScanner.advertisements:
+            self._callback(device, advertisement)
+
+    async def stop(self) -> None:
+        self.scanning = False
+
+
+def advertisement(address: str, name: Optional[str] = None, service_uuids=(), rssi: int = -50):
+    """Build a (device, advertisement data) pair as bleak reports it."""
+    device = SimpleNamespace(address=address, name=name)
+    data = SimpleNamespace(local_name=name, service_uuids=list(service_uuids), rssi=rssi)
+    return device, data
+
+
+@pytest.fixture
+def fake_scanner(monkeypatch):
+    """Replace BleakScanner in the client module with FakeBleakScanner."""
+    monkeypatch.setattr(FakeBleakScanner, "advertisements", [])
+    monkeypatch.setattr(FakeBleakScanner, "failing_starts", 0)
+    monkeypatch.setattr(FakeBleakScanner, "instances", [])
+    monkeypatch.setattr(bluetooth_client, "BleakScanner", FakeBleakScanner)
+    return FakeBleakScanner
+
+
+@pytest.fixture
+def fake_bleak(monkeypatch):
+    """Replace BleakClient in the client module with FakeBleakClient."""
+    monkeypatch.setattr(FakeBleakClient, "payloads", {})
+    monkeypatch.setattr(FakeBleakClient, "gatt_reads", {})
+    monkeypatch.setattr(FakeBleakClient, "instances", [])
+    monkeypatch.setattr(bluetooth_client, "BleakClient", FakeBleakClient)
+    return FakeBleakClient
+
+
+@pytest.fixture
+async def client(fake_bleak):
+    """A ThingyBLEClient connected to a fake device."""
+    ble = ThingyBLEClient(auto_reconnect=False)
+    assert await ble.connect("AA:BB:CC:DD:EE:FF")
+    yield ble
+    await ble.disconnect()
@@ -14,7 +14,8 @@ if __name__ == "__main__":
         print("\nStarting Nordic Thingy:52 MCP Server...\n")
 
         # Import and run the server
-        from src.server import mcp
+        from src.server import install_uvloop, mcp
+        install_uvloop()
         mcp.run()
 
     except ImportError as e:
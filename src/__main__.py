@@ -0,0 +1,6 @@
+"""Allow running the MCP server with ``python -m src``."""
+
+from .server import main
+
+if __name__ == "__main__":
+    main()
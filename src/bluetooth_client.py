@@ -1,16 +1,25 @@
 """Bluetooth LE client for Nordic Thingy:52."""
 
 import asyncio
+import functools
 import logging
-from typing import List, Optional
+import random
+import re
+import struct
+import time
+from types import MappingProxyType
+from typing import AsyncIterator, Callable, Dict, Iterable, List, Mapping, Optional, Set, Tuple, Union
 
 from bleak import BleakClient, BleakScanner
+from bleak.backends.characteristic import BleakGATTCharacteristic
 from bleak.backends.device import BLEDevice
+from bleak.backends.scanner import AdvertisementData
 
 from .constants import (
     AIR_QUALITY_UUID,
     BATTERY_LEVEL_UUID,
     COLOR_UUID,
+    CONFIGURATION_SERVICE_UUID,
     ENVIRONMENT_CONFIG_UUID,
     EULER_UUID,
     HEADING_UUID,
@@ -18,6 +27,7 @@ from .constants import (
     LED_UUID,
     MOTION_CONFIG_UUID,
     ORIENTATION_UUID,
+    ORIENTATIONS,
     PRESSURE_UUID,
     QUATERNION_UUID,
     RAW_DATA_UUID,
@@ -25,14 +35,268 @@ from .constants import (
     SPEAKER_DATA_UUID,
     SPEAKER_STATUS_UUID,
     STEP_COUNTER_UUID,
+    TAP_DIRECTIONS,
     TAP_UUID,
     TEMPERATURE_UUID,
     THINGY_NAME_PATTERNS,
+    THINGY_SERVICE_UUIDS,
 )
 from .models import ColorData, DeviceInfo, EnvironmentalData
 
 logger = logging.getLogger(__name__)
 
+# bleak reports advertised service UUIDs in lowercase
+_ADVERTISED_SERVICE_UUID = CONFIGURATION_SERVICE_UUID.lower()
+
+# Matches any of the name patterns anywhere in the device name
+_THINGY_NAME_RE = re.compile("|".join(map(re.escape, THINGY_NAME_PATTERNS)))
+
+
+def _is_thingy(device: BLEDevice, advertisement_data: AdvertisementData) -> bool:
+    """Check whether an advertisement comes from a Thingy:52."""
+    # A Thingy is recognised by its advertised service UUID, so renamed
+    # devices are found too. Thingys that only match by name are still
+    # accepted, which is why scans don't filter on the service at OS level.
+    if _ADVERTISED_SERVICE_UUID in advertisement_data.service_uuids:
+        return True
+    return bool(device.name) and _THINGY_NAME_RE.search(device.name) is not None
+
+
+# Sensor payload layouts (all little-endian)
+_TEMPERATURE_STRUCT = struct.Struct("<bB")  # integer (int8) + decimal (uint8)
+_PRESSURE_STRUCT = struct.Struct("<iB")  # integer (int32) + decimal (uint8)
+_AIR_QUALITY_STRUCT = struct.Struct("<HH")  # eCO2 (uint16) + TVOC (uint16)
+_COLOR_STRUCT = struct.Struct("<4H")  # red, green, blue, clear: uint16 each
+_COLOR_CLEAR_STRUCT = struct.Struct("<6xH")  # clear channel only, skipping RGB
+_STEP_COUNTER_STRUCT = struct.Struct("<I")  # step count (uint32)
+_RAW_MOTION_STRUCT = struct.Struct("<9h")  # accel, gyro, compass: 3 x int16 each
+_QUATERNION_STRUCT = struct.Struct("<4i")  # w, x, y, z: int32 fixed point each
+_EULER_STRUCT = struct.Struct("<3i")  # roll, pitch, yaw: int32 fixed point each
+_HEADING_STRUCT = struct.Struct("<i")  # heading: int32 fixed point
+
+# Minimum notification payload length for each sensor characteristic
+_EXPECTED_LEN = {
+    TEMPERATURE_UUID: _TEMPERATURE_STRUCT.size,
+    HUMIDITY_UUID: 1,
+    PRESSURE_UUID: _PRESSURE_STRUCT.size,
+    AIR_QUALITY_UUID: _AIR_QUALITY_STRUCT.size,
+    COLOR_UUID: _COLOR_STRUCT.size,
+    STEP_COUNTER_UUID: _STEP_COUNTER_STRUCT.size,
+    TAP_UUID: 2,
+    ORIENTATION_UUID: 1,
+    RAW_DATA_UUID: _RAW_MOTION_STRUCT.size,
+    QUATERNION_UUID: _QUATERNION_STRUCT.size,
+    EULER_UUID: _EULER_STRUCT.size,
+    HEADING_UUID: _HEADING_STRUCT.size,
+}
+
+
+def _payload_too_short(char_uuid: str, data: bytes) -> bool:
+    """Check a notification payload against _EXPECTED_LEN, logging short ones."""
+    expected = _EXPECTED_LEN.get(char_uuid, 0)
+    if len(data) < expected:
+        logger.error(
+            "Notification from %s too short: expected %s bytes, got %s",
+            char_uuid, expected, len(data),
+        )
+        return True
+    return False
+
+# Fixed-point scale factors. Both are powers of two, so multiplying by the
+# reciprocal gives exactly the same result as dividing.
+_Q30_SCALE = 1.0 / (1 << 30)  # quaternion components (30 fractional bits)
+_Q16_SCALE = 1.0 / 65536.0  # angles in degrees (16 fractional bits)
+
+# Configuration layouts: four uint16 intervals followed by a uint8 mode/flag
+_ENVIRONMENT_CONFIG_STRUCT = struct.Struct("<4HB")
+_MOTION_CONFIG_STRUCT = struct.Struct("<4HB")
+
+# Devices found by a scan are reused by connect() for this long (seconds)
+_SCAN_CACHE_TTL = 30.0
+
+# Environment config updates made within this window are merged into one write
+_ENV_CONFIG_COALESCE_DELAY = 0.02  # seconds
+
+# Standard LED colors as (code, R, G, B) tuples
+_LED_PALETTE = (
+    (0x01, 255, 0, 0),      # RED
+    (0x02, 0, 255, 0),      # GREEN
+    (0x03, 255, 255, 0),    # YELLOW
+    (0x04, 0, 0, 255),      # BLUE
+    (0x05, 255, 0, 255),    # PURPLE/MAGENTA
+    (0x06, 0, 255, 255),    # CYAN
+    (0x07, 255, 255, 255),  # WHITE
+)
+
+# Exact palette colors, mapped straight to their code
+_LED_EXACT_CODES = {(r, g, b): code for code, r, g, b in _LED_PALETTE}
+
+# LED frame layouts
+_LED_OFF = bytes([0x00])
+_LED_CONSTANT_STRUCT = struct.Struct("<4B")  # mode, green, red, blue
+_LED_BREATHE_STRUCT = struct.Struct("<3BH")  # mode, color code, intensity, delay (uint16)
+_LED_ONE_SHOT_STRUCT = struct.Struct("<3B")  # mode, color code, intensity
+
+# Intensity percentage (0-100) scaled to the 0-255 byte the device expects
+_INTENSITY_BYTE = bytes(i * 255 // 100 for i in range(101))
+
+_LED_COLOR_NAMES = {
+    0x01: "RED", 0x02: "GREEN", 0x03: "YELLOW", 0x04: "BLUE",
+    0x05: "PURPLE", 0x06: "CYAN", 0x07: "WHITE"
+}
+
+
+def _intensity_byte(intensity: int) -> int:
+    """Convert an intensity percentage (0-100) to the device's 0-255 scale."""
+    if not 0 <= intensity <= 100:
+        raise ValueError(f"Invalid LED intensity: {intensity}. Must be 0-100.")
+    return _INTENSITY_BYTE[intensity]
+
+
+@functools.lru_cache(maxsize=4096)
+def _rgb_to_color_code(red: int, green: int, blue: int) -> int:
+    """
+    Convert RGB values to Nordic Thingy:52 color code.
+
+    Color codes:
+    0x01 = RED, 0x02 = GREEN, 0x03 = YELLOW, 0x04 = BLUE,
+    0x05 = PURPLE, 0x06 = CYAN, 0x07 = WHITE
+
+    Results are memoized, as LED animations tend to repeat the same colors.
+
+    Args:
+        red: Red value (0-255)
+        green: Green value (0-255)
+        blue: Blue value (0-255)
+
+    Returns:
+        Color code (1-7)
+    """
+    code = _LED_EXACT_CODES.get((red, green, blue))
+    if code is not None:
+        return code
+
+    # Find the closest color by Euclidean distance; comparing squared
+    # distances gives the same result without the square root
+    min_distance = float('inf')
+    closest_code = 0x01
+
+    for code, r, g, b in _LED_PALETTE:
+        dr = red - r
+        dg = green - g
+        db = blue - b
+        distance = dr * dr + dg * dg + db * db
+        if distance < min_distance:
+            min_distance = distance
+            closest_code = code
+
+    return closest_code
+
+
+def _make_tap_result(direction: int, count: int) -> Mapping[str, object]:
+    """Build the read-only tap event result for a direction byte and tap count."""
+    return MappingProxyType({
+        "type": "double" if count == 2 else "single",
+        "direction": TAP_DIRECTIONS[direction] if direction < len(TAP_DIRECTIONS) else "unknown",
+        "count": count,
+    })
+
+
+# Tap results for every known direction and single/double count, shared between calls
+_TAP_RESULTS = {
+    (direction, count): _make_tap_result(direction, count)
+    for direction in range(len(TAP_DIRECTIONS))
+    for count in (1, 2)
+}
+
+# Speaker data payload for each built-in sound sample (IDs 1-8)
+_SOUND_PAYLOADS = {sound_id: bytes([sound_id]) for sound_id in range(1, 9)}
+
+
+class _ScanEntry:
+    """Latest advertisement details for a device seen during a scan."""
+
+    __slots__ = ("device", "name", "rssi")
+
+    def __init__(self, device: BLEDevice, name: str, rssi: int) -> None:
+        """Record a newly discovered device."""
+        self.device = device
+        self.name = name
+        self.rssi = rssi
+
+
+class _NotificationDispatcher:
+    """Route notifications from each characteristic to its registered consumers."""
+
+    def __init__(self) -> None:
+        """Initialize the dispatcher with no consumers."""
+        self._consumers: Dict[str, List[Callable[[bytes], None]]] = {}
+        # Called when clear() drops the consumer, keyed by consumer
+        self._on_clear: Dict[Callable[[bytes], None], Callable[[], None]] = {}
+
+    def handler(self, char_uuid: str) -> Callable[[object, bytes], None]:
+        """
+        Create the bleak notification callback for a characteristic.
+
+        Args:
+            char_uuid: Characteristic UUID the callback is registered for
+
+        Returns:
+            Callback passing each notification to the current consumers
+        """
+        def dispatch(sender, data):
+            """Call every consumer of this characteristic with the notification."""
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Received notification from %s: %s", char_uuid, data.hex())
+            consumers = self._consumers.get(char_uuid)
+            if consumers:
+                # Copy so consumers can remove themselves while being called
+                for consumer in tuple(consumers):
+                    # A failing consumer must not starve the ones after it
+                    try:
+                        consumer(data)
+                    except Exception:
+                        logger.exception("Notification consumer for %s failed", char_uuid)
+
+        return dispatch
+
+    def add(
+        self,
+        char_uuid: str,
+        consumer: Callable[[bytes], None],
+        on_clear: Optional[Callable[[], None]] = None,
+    ) -> None:
+        """
+        Register a consumer for notifications from a characteristic.
+
+        Args:
+            char_uuid: Characteristic UUID to consume
+            consumer: Called with each notification payload
+            on_clear: Called if the consumer is dropped by clear(), i.e. when
+                the connection is reset (optional)
+        """
+        self._consumers.setdefault(char_uuid, []).append(consumer)
+        if on_clear is not None:
+            self._on_clear[consumer] = on_clear
+
+    def remove(self, char_uuid: str, consumer: Callable[[bytes], None]) -> None:
+        """Unregister a consumer, ignoring consumers that are not registered."""
+        consumers = self._consumers.get(char_uuid)
+        if consumers and consumer in consumers:
+            consumers.remove(consumer)
+        self._on_clear.pop(consumer, None)
+
+    def clear(self) -> None:
+        """Unregister all consumers, telling those that asked for it."""
+        on_clear = tuple(self._on_clear.values())
+        self._consumers.clear()
+        self._on_clear.clear()
+        for callback in on_clear:
+            try:
+                callback()
+            except Exception:
+                logger.exception("Notification clear callback failed")
+
 
 class ThingyBLEClient:
     """Bluetooth LE client for Nordic Thingy:52 devices."""
@@ -56,8 +320,25 @@ class ThingyBLEClient:
         self.client: Optional[BleakClient] = None
         self.device: Optional[BLEDevice] = None
         self._connected = False
-        self._notification_data: Optional[bytes] = None
-        self._notification_event: Optional[asyncio.Event] = None
+        # Resolved GATT characteristics for the current connection, keyed by UUID
+        self._char_cache: Dict[str, BleakGATTCharacteristic] = {}
+        # Characteristics with an active notification subscription
+        self._subscriptions: Set[str] = set()
+        # Serializes start_notify so concurrent reads subscribe only once
+        self._subscribe_lock = asyncio.Lock()
+        # Routes notifications from subscribed characteristics to reads and streams
+        self._dispatcher = _NotificationDispatcher()
+        # Last environment configuration written to the device
+        self._env_config_cache: Optional[bytes] = None
+        # Whether the motion sensors have been configured on this connection
+        self._motion_configured = False
+        # Last (speaker mode, microphone mode) written to the device
+        self._speaker_config: Optional[tuple[int, int]] = None
+        # Last payload written to the LED characteristic, None if unknown
+        self._last_led: Optional[bytes] = None
+        # Environment configuration waiting for the coalesced write
+        self._pending_env_config: Optional[bytes] = None
+        self._env_flush_task: Optional[asyncio.Task] = None
 
         # Auto-reconnect configuration
         self.auto_reconnect = auto_reconnect
@@ -70,11 +351,38 @@ class ThingyBLEClient:
         self._manual_disconnect = False
         self._reconnecting = False
         self._reconnect_task: Optional[asyncio.Task] = None
+        # Recently scanned devices and when each was last seen, keyed by uppercase address
+        self._scan_cache: Dict[str, Tuple[BLEDevice, float]] = {}
+        # Scanner shared by all scan() calls, created on first use
+        self._scanner: Optional[BleakScanner] = None
+        self._scan_lock = asyncio.Lock()
+        # Detection callback of the scan currently running, if any
+        self._scan_callback: Optional[Callable[[BLEDevice, AdvertisementData], None]] = None
+        # Set to end the wait between reconnection attempts early
+        self._stop_reconnect = asyncio.Event()
         self._retry_count = 0
 
     @property
     def is_connected(self) -> bool:
-        """Check if connected to a device."""
+        """
+        Check if connected to a device.
+
+        Returns the cached connection flag, which connect(), disconnect() and the
+        disconnect callback keep up to date. Use verify_connected() to also ask
+        the backend.
+        """
+        return self._connected
+
+    def verify_connected(self) -> bool:
+        """
+        Check the connection against the BLE backend.
+
+        Unlike is_connected, this queries the backend's link state, which may be
+        an IPC call (e.g. D-Bus on BlueZ).
+
+        Returns:
+            True if the device is connected
+        """
         return self._connected and self.client is not None and self.client.is_connected
 
     @property
@@ -99,6 +407,66 @@ class ThingyBLEClient:
         else:
             return "disconnected"
 
+    def _require_connected(self) -> BleakClient:
+        """
+        Return the active client, raising if not connected.
+
+        Raises:
+            ConnectionError: If no device is connected
+        """
+        if not self._connected or self.client is None:
+            raise ConnectionError("Not connected to a device")
+        return self.client
+
+    def _characteristic(self, char_uuid: str) -> Union[BleakGATTCharacteristic, str]:
+        """
+        Resolve a characteristic UUID for the current connection.
+
+        Lookups are cached so bleak does not search the service table on every
+        GATT operation. Falls back to the UUID string if it cannot be resolved.
+
+        Args:
+            char_uuid: Characteristic UUID
+
+        Returns:
+            The GATT characteristic, or the UUID itself if unresolved
+        """
+        char = self._char_cache.get(char_uuid)
+        if char is None:
+            try:
+                char = self.client.services.get_characteristic(char_uuid)
+            except Exception:
+                char = None
+            if char is None:
+                return char_uuid
+            self._char_cache[char_uuid] = char
+        return char
+
+    def _populate_characteristic_cache(self) -> None:
+        """Resolve every discovered characteristic once, right after connecting."""
+        try:
+            for char in self.client.services.characteristics.values():
+                # Constants use uppercase UUIDs, bleak reports them in lowercase
+                self._char_cache.setdefault(char.uuid.upper(), char)
+        except Exception as e:
+            # Lookups fall back to resolving on first use
+            logger.debug("Could not pre-resolve characteristics: %s", e)
+
+    def _reset_connection_cache(self) -> None:
+        """Forget state that is only valid for the current connection."""
+        self._char_cache.clear()
+        self._subscriptions.clear()
+        self._dispatcher.clear()
+        self._env_config_cache = None
+        self._pending_env_config = None
+        # A write queued for the old connection must not be awaited by the new one
+        if self._env_flush_task is not None:
+            self._env_flush_task.cancel()
+            self._env_flush_task = None
+        self._motion_configured = False
+        self._speaker_config = None
+        self._last_led = None
+
     def _on_disconnect(self, client: BleakClient) -> None:
         """
         Callback when device disconnects.
@@ -106,16 +474,20 @@ class ThingyBLEClient:
         Args:
             client: The BleakClient that disconnected
         """
-        logger.warning(f"Device disconnected: {client.address}")
+        logger.warning("Device disconnected: %s", client.address)
         self._connected = False
+        self._reset_connection_cache()
+
+        # Only one reconnect loop may run at a time
+        if self._reconnect_task is not None and not self._reconnect_task.done():
+            return
 
         # Only trigger auto-reconnect if it wasn't a manual disconnect
         if not self._manual_disconnect and self.auto_reconnect and not self._reconnecting:
             logger.info("Unexpected disconnect - starting auto-reconnect...")
             # Schedule reconnection in the background
             try:
-                loop = asyncio.get_event_loop()
-                self._reconnect_task = loop.create_task(self._auto_reconnect())
+                self._reconnect_task = asyncio.create_task(self._auto_reconnect())
             except RuntimeError:
                 logger.error("Cannot schedule reconnection: no event loop running")
 
@@ -129,141 +501,277 @@ class ThingyBLEClient:
 
         self._reconnecting = True
         self._retry_count = 0
-        delay = self.initial_retry_delay
+        self._stop_reconnect.clear()
+        delay = min(self.initial_retry_delay, self.max_retry_delay)
 
         logger.info(
-            f"Starting auto-reconnect to {self._last_address} "
-            f"(max attempts: {'infinite' if self.max_reconnect_attempts == 0 else self.max_reconnect_attempts})"
+            "Starting auto-reconnect to %s (max attempts: %s)",
+            self._last_address,
+            'infinite' if self.max_reconnect_attempts == 0 else self.max_reconnect_attempts,
         )
 
-        while True:
-            # Check if we've exceeded max attempts
-            if self.max_reconnect_attempts > 0 and self._retry_count >= self.max_reconnect_attempts:
-                logger.error(
-                    f"Auto-reconnect failed after {self._retry_count} attempts. Giving up."
-                )
-                self._reconnecting = False
-                return
+        # Don't use the public connect() method to avoid recursion issues.
+        # One client is created by the first attempt and reused by the rest.
+        client: Optional[BleakClient] = None
 
-            self._retry_count += 1
-            logger.info(
-                f"Reconnection attempt {self._retry_count}"
-                f"{f'/{self.max_reconnect_attempts}' if self.max_reconnect_attempts > 0 else ''} "
-                f"in {delay:.1f}s..."
-            )
+        try:
+            while True:
+                # Check if we've exceeded max attempts
+                if self.max_reconnect_attempts > 0 and self._retry_count >= self.max_reconnect_attempts:
+                    logger.error(
+                        "Auto-reconnect failed after %s attempts. Giving up.", self._retry_count
+                    )
+                    self._reconnecting = False
+                    return
 
-            # Wait before attempting reconnection
-            await asyncio.sleep(delay)
+                self._retry_count += 1
+                # Add +/-20% jitter so several clients don't retry in lockstep
+                wait = delay * random.uniform(0.8, 1.2)
+                logger.info(
+                    "Reconnection attempt %s%s in %.1fs...",
+                    self._retry_count,
+                    f'/{self.max_reconnect_attempts}' if self.max_reconnect_attempts > 0 else '',
+                    wait,
+                )
 
-            # Attempt to reconnect
-            try:
-                logger.info(f"Attempting to reconnect to {self._last_address}...")
-                # Don't use the public connect() method to avoid recursion issues
-                # Create a new client and attempt connection
-                self.client = BleakClient(self._last_address, disconnected_callback=self._on_disconnect)
-                await self.client.connect()
-                self._connected = True
-                self._reconnecting = False
-                self._retry_count = 0
-                logger.info(f"Successfully reconnected to {self._last_address}")
-                return
-            except Exception as e:
-                logger.warning(f"Reconnection attempt {self._retry_count} failed: {e}")
+                # Wait before attempting reconnection, unless asked to stop
+                try:
+                    await asyncio.wait_for(self._stop_reconnect.wait(), timeout=wait)
+                    logger.info("Auto-reconnect stopped")
+                    self._reconnecting = False
+                    return
+                except asyncio.TimeoutError:
+                    pass
 
-            # Calculate next delay with exponential backoff
-            delay = min(delay * 2, self.max_retry_delay)
+                # Attempt to reconnect
+                try:
+                    if client is None:
+                        client = BleakClient(
+                            self._last_address,
+                            disconnected_callback=self._on_disconnect,
+                            services=THINGY_SERVICE_UUIDS,
+                        )
+                        self.client = client
+                        self._reset_connection_cache()
+                    logger.info("Attempting to reconnect to %s...", self._last_address)
+                    await client.connect()
+                    self._populate_characteristic_cache()
+                    self._connected = True
+                    self._reconnecting = False
+                    self._retry_count = 0
+                    logger.info("Successfully reconnected to %s", self._last_address)
+                    return
+                except Exception as e:
+                    logger.warning("Reconnection attempt %s failed: %s", self._retry_count, e)
+
+                # Calculate next delay with exponential backoff
+                delay = min(delay * 2, self.max_retry_delay)
+        finally:
+            # However the loop ends (even cancelled or on an unexpected error),
+            # clear the flag, or no later disconnect would start a new loop
+            self._reconnecting = False
+            # Drop the reference to the finished loop so it can be collected
+            # instead of lingering until the next disconnect
+            if self._reconnect_task is asyncio.current_task():
+                self._reconnect_task = None
 
     async def cancel_reconnect(self) -> None:
         """Cancel any ongoing reconnection attempts."""
+        self._stop_reconnect.set()
         if self._reconnect_task and not self._reconnect_task.done():
             logger.info("Cancelling reconnection attempts...")
+            # The stop event ends a pending wait; cancelling also interrupts
+            # an attempt that is in the middle of connecting
             self._reconnect_task.cancel()
             try:
                 await self._reconnect_task
             except asyncio.CancelledError:
                 pass
+        self._reconnect_task = None
         self._reconnecting = False
         self._retry_count = 0
 
-    async def scan(self, timeout: float = 10.0) -> List[DeviceInfo]:
+    def _on_advertisement(self, device: BLEDevice, advertisement_data: AdvertisementData) -> None:
+        """Forward an advertisement from the shared scanner to the running scan."""
+        callback = self._scan_callback
+        if callback is not None:
+            callback(device, advertisement_data)
+
+    async def _discard_scanner(self, scanner: BleakScanner) -> None:
+        """
+        Drop a shared scanner that failed, so the next scan starts with a new one.
+
+        A backend left half-started or stuck in "already scanning" would
+        otherwise make every later scan fail the same way.
+
+        Args:
+            scanner: The scanner that failed
+        """
+        if self._scanner is scanner:
+            self._scanner = None
+        try:
+            await asyncio.wait_for(scanner.stop(), timeout=5.0)
+        except Exception as e:
+            logger.debug("Could not stop discarded BLE scanner: %s", e)
+
+    async def scan(
+        self,
+        timeout: float = 10.0,
+        max_devices: int = 0,
+        addresses: Optional[Iterable[str]] = None,
+    ) -> List[DeviceInfo]:
         """
         Scan for nearby Thingy:52 devices.
 
         Args:
-            timeout: Scan duration in seconds
+            timeout: Maximum scan duration in seconds
+            max_devices: Stop scanning as soon as this many devices are found (0 = no limit)
+            addresses: Stop scanning as soon as all of these addresses are found (optional)
 
         Returns:
             List of discovered Thingy devices
         """
-        logger.info(f"Scanning for Thingy devices (timeout: {timeout}s)...")
+        logger.info("Scanning for Thingy devices (timeout: %ss)...", timeout)
 
         # Use BleakScanner with callback to get RSSI
-        discovered_devices = {}
+        discovered_devices: Dict[str, _ScanEntry] = {}
+        scan_complete = asyncio.Event()
+        pending_addresses = {a.upper() for a in addresses} if addresses else None
 
         def detection_callback(device, advertisement_data):
             """Callback to capture device and RSSI."""
-            if device.name and any(pattern in device.name for pattern in THINGY_NAME_PATTERNS):
-                logger.debug(f"Found device: {device.name} ({device.address}) RSSI: {advertisement_data.rssi}")
-                discovered_devices[device.address] = {
-                    "device": device,
-                    "rssi": advertisement_data.rssi
-                }
+            # Devices advertise repeatedly; for known ones only refresh the
+            # latest RSSI (and name, which may arrive in a scan response)
+            entry = discovered_devices.get(device.address)
+            if entry is not None:
+                entry.rssi = advertisement_data.rssi
+                name = device.name or advertisement_data.local_name
+                if name:
+                    entry.name = name
+                return
+
+            if _is_thingy(device, advertisement_data):
+                name = device.name or advertisement_data.local_name or "Thingy"
+                logger.debug("Found device: %s (%s) RSSI: %s", name, device.address, advertisement_data.rssi)
+                discovered_devices[device.address] = _ScanEntry(
+                    device, name, advertisement_data.rssi
+                )
+                if max_devices and len(discovered_devices) >= max_devices:
+                    scan_complete.set()
+                if pending_addresses:
+                    pending_addresses.discard(device.address.upper())
+                    if not pending_addresses:
+                        scan_complete.set()
 
         try:
-            # Create scanner with detection callback
-            scanner = BleakScanner(detection_callback=detection_callback)
-            
-            # Start scanning with timeout protection
-            logger.debug("Starting BLE scan...")
-            try:
-                await asyncio.wait_for(scanner.start(), timeout=5.0)
-            except asyncio.TimeoutError:
-                logger.error("Timeout while starting BLE scan")
-                return []
-            except Exception as e:
-                logger.error(f"Error starting BLE scan: {e}")
-                return []
-            
-            # Wait for scan duration
-            try:
-                await asyncio.sleep(timeout)
-            except asyncio.CancelledError:
-                logger.warning("Scan interrupted")
-            finally:
-                # Always attempt to stop scanner
+            # The scanner is created once and reused; it forwards advertisements
+            # to whichever scan is active. Thingys are picked out by _is_thingy,
+            # since an OS-level service filter would hide name-only matches.
+            if self._scanner is None:
+                self._scanner = BleakScanner(detection_callback=self._on_advertisement)
+            scanner = self._scanner
+
+            # The shared scanner can only run one scan at a time
+            async with self._scan_lock:
+                self._scan_callback = detection_callback
                 try:
-                    await asyncio.wait_for(scanner.stop(), timeout=5.0)
-                except asyncio.TimeoutError:
-                    logger.warning("Timeout while stopping BLE scan")
-                except Exception as e:
-                    logger.warning(f"Error stopping BLE scan: {e}")
+                    # Start scanning with timeout protection
+                    logger.debug("Starting BLE scan...")
+                    try:
+                        await asyncio.wait_for(scanner.start(), timeout=5.0)
+                    except asyncio.TimeoutError:
+                        logger.error("Timeout while starting BLE scan")
+                        await self._discard_scanner(scanner)
+                        return []
+                    except Exception as e:
+                        logger.error("Error starting BLE scan: %s", e)
+                        await self._discard_scanner(scanner)
+                        return []
+
+                    # Wait for scan duration, returning early once enough devices are found
+                    try:
+                        await asyncio.wait_for(scan_complete.wait(), timeout=timeout)
+                    except asyncio.TimeoutError:
+                        pass
+                    except asyncio.CancelledError:
+                        logger.warning("Scan interrupted")
+                    finally:
+                        # Always attempt to stop scanner; one that fails to stop
+                        # is replaced on the next scan
+                        try:
+                            await asyncio.wait_for(scanner.stop(), timeout=5.0)
+                        except asyncio.TimeoutError:
+                            logger.warning("Timeout while stopping BLE scan")
+                            self._scanner = None
+                        except Exception as e:
+                            logger.warning("Error stopping BLE scan: %s", e)
+                            self._scanner = None
+                finally:
+                    self._scan_callback = None
+
+            # Remember the devices so connect() can skip bleak's own discovery
+            self._remember_scanned(entry.device for entry in discovered_devices.values())
 
             # Process discovered devices
             thingy_devices = []
-            for address, info in discovered_devices.items():
-                device = info["device"]
-                rssi = info["rssi"]
+            for entry in discovered_devices.values():
+                address = entry.device.address
                 thingy_devices.append(
-                    DeviceInfo(address=device.address, name=device.name, rssi=rssi)
+                    DeviceInfo.model_construct(address=address, name=entry.name, rssi=entry.rssi)
                 )
-                logger.info(f"Found Thingy: {device.name} ({device.address}) RSSI: {rssi}")
+                logger.info("Found Thingy: %s (%s) RSSI: %s", entry.name, address, entry.rssi)
 
             return thingy_devices
 
         except Exception as e:
-            logger.error(f"Error during BLE scan: {e}")
+            logger.error("Error during BLE scan: %s", e)
             return []
 
-        thingy_devices = []
-        for address, info in discovered_devices.items():
-            device = info["device"]
-            rssi = info["rssi"]
-            thingy_devices.append(
-                DeviceInfo(address=device.address, name=device.name, rssi=rssi)
-            )
-            logger.info(f"Found Thingy: {device.name} ({device.address}) RSSI: {rssi}")
+    async def find_device(self, timeout: float = 10.0) -> Optional[DeviceInfo]:
+        """
+        Find the first Thingy:52 that advertises nearby.
+
+        Returns as soon as a matching advertisement is received, so this is much
+        faster than a full scan when only one device is needed.
+
+        Args:
+            timeout: Maximum time to wait for an advertisement in seconds
+
+        Returns:
+            The first Thingy device found, or None if none was seen before the timeout
+        """
+        logger.info("Looking for a Thingy device (timeout: %ss)...", timeout)
+        # A one-device scan runs on the shared scanner under the scan lock,
+        # so it never competes with another scan for the adapter
+        devices = await self.scan(timeout=timeout, max_devices=1)
+        if not devices:
+            logger.warning("No Thingy device found")
+            return None
+        return devices[0]
+
+    def _remember_scanned(self, devices: Iterable[BLEDevice]) -> None:
+        """Add freshly discovered devices to the scan cache."""
+        now = time.monotonic()
+        for device in devices:
+            self._scan_cache[device.address.upper()] = (device, now)
+
+    def _scanned_device(self, address: str) -> Union[BLEDevice, str]:
+        """
+        Look up a recently scanned device by address.
 
-        return thingy_devices
+        Args:
+            address: Bluetooth MAC address
+
+        Returns:
+            The cached BLEDevice if it was seen by a recent scan, else the address
+        """
+        cached = self._scan_cache.get(address.upper())
+        if cached is not None:
+            device, seen = cached
+            if time.monotonic() - seen < _SCAN_CACHE_TTL:
+                logger.debug("Using cached scan result for %s", address)
+                return device
+        return address
 
     async def connect(self, address: str, timeout: float = 30.0) -> bool:
         """
@@ -280,19 +788,26 @@ class ThingyBLEClient:
         await self.cancel_reconnect()
 
         try:
-            logger.info(f"Connecting to {address}...")
-            # Create client with disconnect callback
+            logger.info("Connecting to %s...", address)
+            # Create client with disconnect callback. Service discovery is limited
+            # to the Thingy services we actually use to shorten connection setup.
+            # A device from a recent scan lets bleak skip its own discovery scan
             self.client = BleakClient(
-                address, timeout=timeout, disconnected_callback=self._on_disconnect
+                self._scanned_device(address),
+                timeout=timeout,
+                disconnected_callback=self._on_disconnect,
+                services=THINGY_SERVICE_UUIDS,
             )
+            self._reset_connection_cache()
             await self.client.connect()
+            self._populate_characteristic_cache()
             self._connected = True
             self._last_address = address
             self._manual_disconnect = False
-            logger.info(f"Successfully connected to {address}")
+            logger.info("Successfully connected to %s", address)
             return True
         except Exception as e:
-            logger.error(f"Failed to connect to {address}: {e}")
+            logger.error("Failed to connect to %s: %s", address, e)
             self._connected = False
             return False
 
@@ -313,89 +828,275 @@ class ThingyBLEClient:
 
         if self.client and self.is_connected:
             try:
+                await self._unsubscribe_all()
                 await self.client.disconnect()
                 logger.info("Disconnected successfully (manual)")
             except Exception as e:
-                logger.error(f"Error during disconnect: {e}")
+                logger.error("Error during disconnect: %s", e)
             finally:
                 self._connected = False
+                self._reset_connection_cache()
                 return True
         return False
 
-    async def _read_via_notification(self, char_uuid: str, timeout: float = 5.0) -> Optional[bytes]:
+    async def _subscribe(self, char_uuid: str) -> bool:
         """
-        Read a characteristic via notification (Thingy sensors use notifications, not direct reads).
+        Subscribe to notifications for a characteristic, once per connection.
+
+        The subscription stays active so repeated reads do not pay the
+        start_notify/stop_notify round-trips. Notifications are routed through
+        the dispatcher; those arriving while nobody consumes them are dropped.
 
         Args:
-            char_uuid: Characteristic UUID to read
-            timeout: Timeout in seconds
+            char_uuid: Characteristic UUID to subscribe to
 
         Returns:
-            Received data or None on timeout
+            True if subscribed, False if subscribing failed
         """
-        if not self.is_connected or self.client is None:
-            logger.error("Cannot read notifications: not connected to device")
-            return None
+        if char_uuid in self._subscriptions:
+            return True
 
-        self._notification_data = None
-        self._notification_event = asyncio.Event()
+        # Only the CCCD write is serialized; waiting for the notification
+        # itself still overlaps across characteristics
+        async with self._subscribe_lock:
+            # Another read may have subscribed while we waited for the lock
+            if char_uuid in self._subscriptions:
+                return True
 
-        def notification_handler(sender, data):
-            """Handle incoming notification."""
-            logger.debug(f"Received notification from {char_uuid}: {data.hex()}")
-            self._notification_data = data
-            if self._notification_event:
-                self._notification_event.set()
+            try:
+                logger.debug("Subscribing to notifications for %s", char_uuid)
+                await asyncio.wait_for(
+                    self.client.start_notify(
+                        self._characteristic(char_uuid), self._dispatcher.handler(char_uuid)
+                    ),
+                    timeout=5.0
+                )
+            except asyncio.TimeoutError:
+                logger.error("Timeout subscribing to notifications for %s", char_uuid)
+                return False
+            except Exception as e:
+                logger.error("Error subscribing to notifications for %s: %s", char_uuid, e)
+                return False
 
-        try:
-            # Subscribe to notifications with timeout
+            self._subscriptions.add(char_uuid)
+            return True
+
+    async def _unsubscribe_all(self) -> None:
+        """Stop all active notification subscriptions."""
+        for char_uuid in list(self._subscriptions):
             try:
-                logger.debug(f"Subscribing to notifications for {char_uuid}")
+                logger.debug("Unsubscribing from notifications for %s", char_uuid)
                 await asyncio.wait_for(
-                    self.client.start_notify(char_uuid, notification_handler),
+                    self.client.stop_notify(self._characteristic(char_uuid)),
                     timeout=5.0
                 )
             except asyncio.TimeoutError:
-                logger.error(f"Timeout subscribing to notifications for {char_uuid}")
-                return None
+                logger.warning("Timeout unsubscribing from notifications for %s", char_uuid)
             except Exception as e:
-                logger.error(f"Error subscribing to notifications for {char_uuid}: {e}")
+                logger.warning("Error unsubscribing from notifications for %s: %s", char_uuid, e)
+        self._subscriptions.clear()
+
+    async def _read_via_notification(self, char_uuid: str, timeout: float = 5.0) -> Optional[bytes]:
+        """
+        Read a characteristic via notification (Thingy sensors use notifications, not direct reads).
+
+        Args:
+            char_uuid: Characteristic UUID to read
+            timeout: Timeout in seconds
+
+        Returns:
+            Received data or None on timeout
+        """
+        if not self._connected or self.client is None:
+            logger.error("Cannot read notifications: not connected to device")
+            return None
+
+        try:
+            if not await self._subscribe(char_uuid):
                 return None
 
+            # One-shot consumer: only a notification arriving after this point
+            # resolves the read
+            waiter = asyncio.get_running_loop().create_future()
+
+            def resolve(data):
+                if not waiter.done():
+                    waiter.set_result(data)
+
+            def abort():
+                if not waiter.done():
+                    waiter.set_exception(ConnectionError("Connection lost"))
+
+            # Fail fast instead of waiting for the timeout if the link drops
+            self._dispatcher.add(char_uuid, resolve, on_clear=abort)
+
             # Wait for notification with timeout
             try:
-                logger.debug(f"Waiting for notification from {char_uuid} (timeout: {timeout}s)")
-                await asyncio.wait_for(self._notification_event.wait(), timeout=timeout)
-                data = self._notification_data
-                if data is None:
-                    logger.warning(f"Received empty notification from {char_uuid}")
-                return data
+                logger.debug("Waiting for notification from %s (timeout: %ss)", char_uuid, timeout)
+                data = await asyncio.wait_for(waiter, timeout=timeout)
             except asyncio.TimeoutError:
-                logger.warning(f"Timeout waiting for notification from {char_uuid}")
+                logger.warning("Timeout waiting for notification from %s", char_uuid)
                 return None
             except Exception as e:
-                logger.error(f"Error receiving notification from {char_uuid}: {e}")
+                logger.error("Error receiving notification from %s: %s", char_uuid, e)
                 return None
             finally:
-                # Always try to unsubscribe from notifications
-                try:
-                    logger.debug(f"Unsubscribing from notifications for {char_uuid}")
-                    await asyncio.wait_for(
-                        self.client.stop_notify(char_uuid),
-                        timeout=5.0
-                    )
-                except asyncio.TimeoutError:
-                    logger.warning(f"Timeout unsubscribing from notifications for {char_uuid}")
-                except Exception as e:
-                    logger.warning(f"Error unsubscribing from notifications for {char_uuid}: {e}")
+                self._dispatcher.remove(char_uuid, resolve)
+
+            # Payload length is checked here once instead of in every reader
+            if _payload_too_short(char_uuid, data):
+                return None
+            return data
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
-            logger.error(f"Critical error in notification handling for {char_uuid}: {e}")
+            logger.error("Critical error in notification handling for %s: %s", char_uuid, e)
             return None
 
+    async def stream_notifications(self, char_uuid: str) -> AsyncIterator[bytes]:
+        """
+        Yield raw notifications from a characteristic as they arrive.
+
+        Only the latest value is kept, so a slow consumer skips samples rather
+        than falling behind. The stream runs until the caller stops iterating
+        or the connection is lost.
+
+        Args:
+            char_uuid: Characteristic UUID to stream
+
+        Yields:
+            Raw notification payloads
+
+        Raises:
+            ConnectionError: If not connected, subscribing failed or the
+                connection was lost while streaming
+        """
+        self._require_connected()
+        if not await self._subscribe(char_uuid):
+            raise ConnectionError(f"Could not subscribe to notifications for {char_uuid}")
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+
+        def push(data):
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(data)
+
+        # None wakes the consumer when the connection is reset
+        self._dispatcher.add(char_uuid, push, on_clear=lambda: push(None))
+        try:
+            while True:
+                data = await queue.get()
+                if data is None:
+                    raise ConnectionError(f"Connection lost while streaming {char_uuid}")
+                yield data
+        finally:
+            self._dispatcher.remove(char_uuid, push)
+
+    async def start_environmental_stream(
+        self,
+        callback: Callable[[EnvironmentalData], None],
+        on_closed: Optional[Callable[[], None]] = None,
+    ) -> Callable[[], None]:
+        """
+        Stream combined environmental readings to a callback.
+
+        Temperature, humidity, pressure and air quality notifications are
+        decoded as they arrive. Once every sensor has reported since the
+        previous update, the callback receives a single EnvironmentalData
+        holding all values, so callers don't need to poll read_all_environmental.
+
+        The stream ends when the connection is lost or reset; a new stream has
+        to be started after reconnecting.
+
+        Args:
+            callback: Called from the notification handler with each reading
+            on_closed: Called once if the stream ends because the connection
+                was lost or reset (optional)
+
+        Returns:
+            Function that stops the stream
+
+        Raises:
+            ConnectionError: If not connected or subscribing failed
+        """
+        self._require_connected()
+        # The gas sensor only notifies once a measurement mode is set
+        await self.configure_environment_sensors(gas_mode=1)
+
+        current: Dict[str, Union[float, int]] = {}
+        closed = False
+
+        def update(**values) -> None:
+            current.update(values)
+            # temperature, humidity, pressure, co2 and tvoc
+            if len(current) == 5:
+                reading = EnvironmentalData.model_construct(**current)
+                current.clear()
+                try:
+                    callback(reading)
+                except Exception:
+                    logger.exception("Environmental stream callback failed")
+
+        def close() -> None:
+            # Every consumer reports the reset, but the caller hears it once
+            nonlocal closed
+            if closed:
+                return
+            closed = True
+            if on_closed is not None:
+                try:
+                    on_closed()
+                except Exception:
+                    logger.exception("Environmental stream close callback failed")
+
+        # Same payload layouts as the individual read_* methods
+        def on_temperature(data):
+            integer, decimal = _TEMPERATURE_STRUCT.unpack_from(data)
+            update(temperature=integer + decimal / 100.0)
+
+        def on_humidity(data):
+            update(humidity=float(data[0]))
+
+        def on_pressure(data):
+            integer, decimal = _PRESSURE_STRUCT.unpack_from(data)
+            update(pressure=integer + decimal / 100.0)
+
+        def on_air_quality(data):
+            co2, tvoc = _AIR_QUALITY_STRUCT.unpack_from(data)
+            update(co2=co2, tvoc=tvoc)
+
+        consumers = {}
+        for char_uuid, decode in (
+            (TEMPERATURE_UUID, on_temperature),
+            (HUMIDITY_UUID, on_humidity),
+            (PRESSURE_UUID, on_pressure),
+            (AIR_QUALITY_UUID, on_air_quality),
+        ):
+            if not await self._subscribe(char_uuid):
+                raise ConnectionError(f"Could not subscribe to notifications for {char_uuid}")
+
+            def consume(data, char_uuid=char_uuid, decode=decode):
+                if not _payload_too_short(char_uuid, data):
+                    decode(data)
+
+            consumers[char_uuid] = consume
+
+        for char_uuid, consume in consumers.items():
+            self._dispatcher.add(char_uuid, consume, on_clear=close)
+
+        def stop() -> None:
+            # Stopping on purpose is not reported through on_closed
+            nonlocal closed
+            closed = True
+            for char_uuid, consume in consumers.items():
+                self._dispatcher.remove(char_uuid, consume)
+
+        return stop
+
     async def read_temperature(self) -> Optional[float]:
         """Read temperature sensor via notification."""
-        if not self.is_connected or self.client is None:
-            raise ConnectionError("Not connected to a device")
+        self._require_connected()
 
         try:
             data = await self._read_via_notification(TEMPERATURE_UUID, timeout=5.0)
@@ -404,26 +1105,22 @@ class ThingyBLEClient:
                 logger.error("No temperature data received")
                 return None
 
-            logger.debug(f"Raw temperature data: {data.hex()} (length: {len(data)})")
-
-            if len(data) < 2:
-                logger.error(f"Temperature data too short: expected 2 bytes, got {len(data)}")
-                return None
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Raw temperature data: %s (length: %s)", data.hex(), len(data))
 
             # Thingy:52 temperature format: integer (1 byte) + decimal (1 byte)
-            integer = int.from_bytes([data[0]], "little", signed=True)
-            decimal = data[1]
-            temp = float(f"{integer}.{decimal:02d}")
-            logger.info(f"Temperature: {temp}°C")
+            integer, decimal = _TEMPERATURE_STRUCT.unpack_from(data)
+            temp = integer + decimal / 100.0
+            logger.info("Temperature: %s°C", temp)
             return temp
         except Exception as e:
-            logger.error(f"Failed to read temperature: {e}", exc_info=True)
+            logger.error("Failed to read temperature: %s", e)
+            logger.debug("Traceback:", exc_info=True)
             return None
 
     async def read_humidity(self) -> Optional[float]:
         """Read humidity sensor via notification."""
-        if not self.is_connected or self.client is None:
-            raise ConnectionError("Not connected to a device")
+        self._require_connected()
 
         try:
             data = await self._read_via_notification(HUMIDITY_UUID, timeout=5.0)
@@ -432,24 +1129,21 @@ class ThingyBLEClient:
                 logger.error("No humidity data received")
                 return None
 
-            logger.debug(f"Raw humidity data: {data.hex()} (length: {len(data)})")
-
-            if len(data) < 1:
-                logger.error("Humidity data empty")
-                return None
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Raw humidity data: %s (length: %s)", data.hex(), len(data))
 
             # Humidity is single unsigned byte
             humidity = float(data[0])
-            logger.info(f"Humidity: {humidity}%")
+            logger.info("Humidity: %s%%", humidity)
             return humidity
         except Exception as e:
-            logger.error(f"Failed to read humidity: {e}", exc_info=True)
+            logger.error("Failed to read humidity: %s", e)
+            logger.debug("Traceback:", exc_info=True)
             return None
 
     async def read_pressure(self) -> Optional[float]:
         """Read pressure sensor via notification."""
-        if not self.is_connected or self.client is None:
-            raise ConnectionError("Not connected to a device")
+        self._require_connected()
 
         try:
             data = await self._read_via_notification(PRESSURE_UUID, timeout=5.0)
@@ -458,22 +1152,19 @@ class ThingyBLEClient:
                 logger.error("No pressure data received")
                 return None
 
-            logger.debug(f"Raw pressure data: {data.hex()} (length: {len(data)})")
-
-            if len(data) < 5:
-                logger.error(f"Pressure data too short: expected 5 bytes, got {len(data)}")
-                return None
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Raw pressure data: %s (length: %s)", data.hex(), len(data))
 
             # Pressure format: integer (4 bytes little-endian) + decimal (1 byte)
             # The value is already in hPa (hectopascals), not Pascals
-            integer = int.from_bytes(data[0:4], "little", signed=True)
-            decimal = data[4]
+            integer, decimal = _PRESSURE_STRUCT.unpack_from(data)
             # Combine: integer part + decimal part (0-99 range)
             pressure_hpa = integer + (decimal / 100.0)
-            logger.info(f"Pressure: {pressure_hpa} hPa (raw: int={integer}, dec={decimal})")
+            logger.info("Pressure: %s hPa (raw: int=%s, dec=%s)", pressure_hpa, integer, decimal)
             return pressure_hpa
         except Exception as e:
-            logger.error(f"Failed to read pressure: {e}", exc_info=True)
+            logger.error("Failed to read pressure: %s", e)
+            logger.debug("Traceback:", exc_info=True)
             return None
 
     async def configure_environment_sensors(
@@ -488,7 +1179,8 @@ class ThingyBLEClient:
         Configure environment sensor parameters using read-modify-write pattern.
 
         This uses the same approach as the Nordic Node.js library: read current config,
-        modify only the requested parameters, then write back.
+        modify only the requested parameters, then write back. Calls made within
+        a short window are merged, so the device receives a single write.
 
         Args:
             temp_interval_ms: Temperature update interval in milliseconds (optional)
@@ -500,69 +1192,123 @@ class ThingyBLEClient:
         Returns:
             True if successful
         """
-        if not self.is_connected or self.client is None:
-            raise ConnectionError("Not connected to a device")
+        client = self._require_connected()
 
         try:
-            # Read current configuration (read-modify-write pattern)
-            try:
-                current_config = await self.client.read_gatt_char(ENVIRONMENT_CONFIG_UUID)
-                config = bytearray(current_config)
-                logger.debug(f"Current environment config: {config.hex()}")
-            except Exception as e:
-                logger.warning(f"Could not read current config, using defaults: {e}")
-                # If read fails, create default config
-                config = bytearray(9)
-                config[0:2] = (1000).to_bytes(2, "little")  # temp: 1000ms
-                config[2:4] = (1000).to_bytes(2, "little")  # pressure: 1000ms
-                config[4:6] = (1000).to_bytes(2, "little")  # humidity: 1000ms
-                config[6:8] = (1000).to_bytes(2, "little")  # color: 1000ms
-                config[8] = 1  # gas mode: 1s
-
-            # Ensure config is at least 9 bytes
-            if len(config) < 9:
-                # Pad with default values if needed
-                while len(config) < 9:
-                    config.append(0)
-
             # Environment config format (Nordic Thingy:52 specification):
             # Bytes 0-1: Temperature interval (uint16 little-endian)
             # Bytes 2-3: Pressure interval (uint16 little-endian)
             # Bytes 4-5: Humidity interval (uint16 little-endian)
             # Bytes 6-7: Color interval (uint16 little-endian)
             # Byte 8: Gas sensor mode (uint8: 1, 2, or 3)
+            # Any further bytes (color sensor calibration) are preserved as-is
+
+            # Read current configuration (read-modify-write pattern), building on
+            # a pending or already written one when this connection has it
+            size = _ENVIRONMENT_CONFIG_STRUCT.size
+            try:
+                current_config = self._pending_env_config or self._env_config_cache
+                if current_config is None:
+                    current_config = bytes(
+                        await client.read_gatt_char(self._characteristic(ENVIRONMENT_CONFIG_UUID))
+                    )
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Current environment config: %s", current_config.hex())
+                # Pad with zeros if the config is shorter than expected
+                temp_ms, pressure_ms, humidity_ms, color_ms, current_gas_mode = (
+                    _ENVIRONMENT_CONFIG_STRUCT.unpack(current_config[:size].ljust(size, b"\x00"))
+                )
+                trailer = current_config[size:]
+            except Exception as e:
+                logger.warning("Could not read current config, using defaults: %s", e)
+                # If read fails, use defaults: 1000ms intervals and 1s gas mode
+                temp_ms = pressure_ms = humidity_ms = color_ms = 1000
+                current_gas_mode = 1
+                trailer = b""
 
             # Modify only the parameters that were provided
             if temp_interval_ms is not None:
-                config[0:2] = temp_interval_ms.to_bytes(2, "little")
+                temp_ms = temp_interval_ms
             if pressure_interval_ms is not None:
-                config[2:4] = pressure_interval_ms.to_bytes(2, "little")
+                pressure_ms = pressure_interval_ms
             if humidity_interval_ms is not None:
-                config[4:6] = humidity_interval_ms.to_bytes(2, "little")
+                humidity_ms = humidity_interval_ms
             if color_interval_ms is not None:
-                config[6:8] = color_interval_ms.to_bytes(2, "little")
+                color_ms = color_interval_ms
             if gas_mode is not None:
                 if gas_mode not in [1, 2, 3]:
                     raise ValueError("Gas mode must be 1, 2, or 3")
-                config[8] = gas_mode
+                current_gas_mode = gas_mode
 
-            # Write back the modified configuration
-            await self.client.write_gatt_char(ENVIRONMENT_CONFIG_UUID, bytes(config), response=False)
+            config = _ENVIRONMENT_CONFIG_STRUCT.pack(
+                temp_ms, pressure_ms, humidity_ms, color_ms, current_gas_mode
+            ) + trailer
 
-            logger.debug(f"Environment config written: {config.hex()}")
-            logger.info(
-                f"Environment sensors configured: "
-                f"temp={int.from_bytes(config[0:2], 'little')}ms, "
-                f"pressure={int.from_bytes(config[2:4], 'little')}ms, "
-                f"humidity={int.from_bytes(config[4:6], 'little')}ms, "
-                f"color={int.from_bytes(config[6:8], 'little')}ms, "
-                f"gas_mode={config[8]}"
+            # Skip the write if the device already has this configuration
+            if self._env_flush_task is None and config == self._env_config_cache:
+                logger.debug("Environment config unchanged, skipping write")
+                return True
+
+            # Queue the configuration; one write is made for the whole window
+            self._pending_env_config = config
+            if self._env_flush_task is None:
+                self._env_flush_task = asyncio.create_task(self._flush_environment_config())
+            flush = self._env_flush_task
+        except Exception as e:
+            logger.error("Failed to configure environment sensors: %s", e)
+            return False
+
+        # Shield the shared write so one cancelled caller doesn't cancel it for all
+        try:
+            written = await asyncio.shield(flush)
+        except asyncio.CancelledError:
+            if not flush.cancelled():
+                raise
+            # The connection was reset before the write was made
+            logger.error("Failed to configure environment sensors: connection lost")
+            return False
+        if not written:
+            return False
+
+        logger.info(
+            "Environment sensors configured: temp=%sms, pressure=%sms, "
+            "humidity=%sms, color=%sms, gas_mode=%s",
+            temp_ms, pressure_ms, humidity_ms, color_ms, current_gas_mode,
+        )
+        return True
+
+    async def _flush_environment_config(self) -> bool:
+        """
+        Write the pending environment configuration after the coalescing window.
+
+        Returns:
+            True if the configuration was written
+        """
+        await asyncio.sleep(_ENV_CONFIG_COALESCE_DELAY)
+        config = self._pending_env_config
+        self._pending_env_config = None
+        self._env_flush_task = None
+        if config is None:
+            # Connection was reset while the write was pending
+            logger.error("Failed to configure environment sensors: connection lost")
+            return False
+
+        try:
+            client = self._require_connected()
+            # Record the configuration first so calls made during the write build on it
+            self._env_config_cache = config
+            await client.write_gatt_char(
+                self._characteristic(ENVIRONMENT_CONFIG_UUID), config, response=False
             )
-            return True
         except Exception as e:
-            logger.error(f"Failed to configure environment sensors: {e}")
+            self._env_config_cache = None
+            logger.error("Failed to configure environment sensors: %s", e)
             return False
 
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Environment config written: %s", config.hex())
+        return True
+
     async def read_air_quality(self) -> tuple[Optional[int], Optional[int]]:
         """
         Read air quality sensor (CO2 and TVOC) via notification.
@@ -583,13 +1329,14 @@ class ThingyBLEClient:
         Returns:
             Tuple of (CO2 in ppm, TVOC in ppb)
         """
-        if not self.is_connected or self.client is None:
-            raise ConnectionError("Not connected to a device")
+        self._require_connected()
 
         try:
             # Configure environment sensors with gas mode for faster readings
+            previous_config = self._env_config_cache
             await self.configure_environment_sensors(gas_mode=1)  # 1 second mode
-            await asyncio.sleep(1.5)  # Give gas sensor time to warm up
+            if self._env_config_cache is None or self._env_config_cache != previous_config:
+                await asyncio.sleep(1.5)  # Give gas sensor time to warm up after a change
 
             data = await self._read_via_notification(AIR_QUALITY_UUID, timeout=5.0)
 
@@ -597,36 +1344,32 @@ class ThingyBLEClient:
                 logger.error("No air quality data received")
                 return (None, None)
 
-            logger.debug(f"Raw air quality data: {data.hex()} (length: {len(data)})")
-
-            if len(data) < 4:
-                logger.error(f"Air quality data too short: expected 4 bytes, got {len(data)}")
-                return (None, None)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Raw air quality data: %s (length: %s)", data.hex(), len(data))
 
             # Air quality format (CCS811 sensor):
             # Bytes 0-1: eCO2 (equivalent CO2) in ppm - uint16 little-endian
             # Bytes 2-3: TVOC (Total Volatile Organic Compounds) in ppb - uint16 little-endian
-            co2 = int.from_bytes(data[0:2], "little", signed=False)
-            tvoc = int.from_bytes(data[2:4], "little", signed=False)
+            co2, tvoc = _AIR_QUALITY_STRUCT.unpack_from(data)
 
             # Log with context about sensor warm-up
             if co2 == 0 and tvoc == 0:
                 logger.info(
-                    f"Air quality - CO2: {co2} ppm, TVOC: {tvoc} ppb "
-                    "(Note: 0 values indicate sensor is warming up - wait 30-60 minutes)"
+                    "Air quality - CO2: %s ppm, TVOC: %s ppb "
+                    "(Note: 0 values indicate sensor is warming up - wait 30-60 minutes)",
+                    co2, tvoc,
                 )
             else:
-                logger.info(f"Air quality - CO2: {co2} ppm, TVOC: {tvoc} ppb")
+                logger.info("Air quality - CO2: %s ppm, TVOC: %s ppb", co2, tvoc)
 
             return (co2, tvoc)
         except Exception as e:
-            logger.error(f"Failed to read air quality: {e}")
+            logger.error("Failed to read air quality: %s", e)
             return (None, None)
 
     async def read_color(self) -> Optional[ColorData]:
         """Read color sensor via notification (includes light intensity in clear channel)."""
-        if not self.is_connected or self.client is None:
-            raise ConnectionError("Not connected to a device")
+        self._require_connected()
 
         try:
             data = await self._read_via_notification(COLOR_UUID, timeout=5.0)
@@ -636,18 +1379,15 @@ class ThingyBLEClient:
                 return None
 
             # RGBC: 2 bytes each
-            red = int.from_bytes(data[0:2], "little", signed=False)
-            green = int.from_bytes(data[2:4], "little", signed=False)
-            blue = int.from_bytes(data[4:6], "little", signed=False)
-            clear = int.from_bytes(data[6:8], "little", signed=False)
+            red, green, blue, clear = _COLOR_STRUCT.unpack_from(data)
 
             # Clear channel represents light intensity (approximation of lux)
             # Nordic Thingy uses clear channel as ambient light sensor
-            logger.debug(f"Color: R={red}, G={green}, B={blue}, Light={clear} lux")
+            logger.debug("Color: R=%s, G=%s, B=%s, Light=%s lux", red, green, blue, clear)
 
             return ColorData(red=red, green=green, blue=blue, clear=clear)
         except Exception as e:
-            logger.error(f"Failed to read color sensor: {e}")
+            logger.error("Failed to read color sensor: %s", e)
             return None
 
     async def read_light_intensity(self) -> Optional[int]:
@@ -656,23 +1396,35 @@ class ThingyBLEClient:
 
         Note: This uses the clear channel of the color sensor.
         """
-        color_data = await self.read_color()
-        if color_data:
-            return color_data.clear
-        return None
+        self._require_connected()
+
+        try:
+            data = await self._read_via_notification(COLOR_UUID, timeout=5.0)
+
+            if data is None:
+                logger.error("No color sensor data received")
+                return None
+
+            # Only the clear channel is needed, so skip decoding RGB
+            (clear,) = _COLOR_CLEAR_STRUCT.unpack_from(data)
+            logger.debug("Light intensity: %s lux", clear)
+
+            return clear
+        except Exception as e:
+            logger.error("Failed to read light intensity: %s", e)
+            return None
 
     async def read_battery(self) -> Optional[int]:
         """Read battery level."""
-        if not self.is_connected or self.client is None:
-            raise ConnectionError("Not connected to a device")
+        client = self._require_connected()
 
         try:
-            data = await self.client.read_gatt_char(BATTERY_LEVEL_UUID)
+            data = await client.read_gatt_char(self._characteristic(BATTERY_LEVEL_UUID))
             battery = int(data[0])
-            logger.debug(f"Battery: {battery}%")
+            logger.debug("Battery: %s%%", battery)
             return battery
         except Exception as e:
-            logger.error(f"Failed to read battery: {e}")
+            logger.error("Failed to read battery: %s", e)
             return None
 
     async def configure_motion_sensors(
@@ -696,8 +1448,7 @@ class ThingyBLEClient:
         Returns:
             True if successful
         """
-        if not self.is_connected or self.client is None:
-            raise ConnectionError("Not connected to a device")
+        client = self._require_connected()
 
         try:
             # Motion config format: 9 bytes
@@ -707,32 +1458,40 @@ class ThingyBLEClient:
             # Bytes 6-7: Motion frequency (uint16 little-endian)
             # Byte 8: Wake on motion (uint8)
 
-            config = bytearray(9)
-            config[0:2] = step_interval_ms.to_bytes(2, "little")
-            config[2:4] = temp_comp_interval_ms.to_bytes(2, "little")
-            config[4:6] = mag_comp_interval_ms.to_bytes(2, "little")
-            config[6:8] = motion_freq_hz.to_bytes(2, "little")
-            config[8] = 1 if wake_on_motion else 0
+            config = _MOTION_CONFIG_STRUCT.pack(
+                step_interval_ms,
+                temp_comp_interval_ms,
+                mag_comp_interval_ms,
+                motion_freq_hz,
+                1 if wake_on_motion else 0,
+            )
 
-            await self.client.write_gatt_char(MOTION_CONFIG_UUID, bytes(config), response=False)
+            await client.write_gatt_char(
+                self._characteristic(MOTION_CONFIG_UUID), config, response=False
+            )
+            self._motion_configured = True
             logger.info(
-                f"Motion sensors configured: step={step_interval_ms}ms, "
-                f"freq={motion_freq_hz}Hz, wake={wake_on_motion}"
+                "Motion sensors configured: step=%sms, freq=%sHz, wake=%s",
+                step_interval_ms, motion_freq_hz, wake_on_motion,
             )
             return True
         except Exception as e:
-            logger.error(f"Failed to configure motion sensors: {e}")
+            logger.error("Failed to configure motion sensors: %s", e)
             return False
 
+    async def _ensure_motion(self) -> None:
+        """Configure the motion sensors once per connection before reading them."""
+        if not self._motion_configured:
+            await self.configure_motion_sensors()
+            await asyncio.sleep(0.5)  # Give sensors time to initialize
+
     async def read_step_count(self) -> Optional[int]:
         """Read step counter via notification."""
-        if not self.is_connected or self.client is None:
-            raise ConnectionError("Not connected to a device")
+        self._require_connected()
 
         try:
             # Ensure motion sensors are configured
-            await self.configure_motion_sensors()
-            await asyncio.sleep(0.5)  # Give sensors time to initialize
+            await self._ensure_motion()
 
             data = await self._read_via_notification(STEP_COUNTER_UUID, timeout=5.0)
 
@@ -740,66 +1499,37 @@ class ThingyBLEClient:
                 logger.error("No step count data received")
                 return None
 
-            steps = int.from_bytes(data[0:4], "little", signed=False)
-            logger.debug(f"Steps: {steps}")
+            (steps,) = _STEP_COUNTER_STRUCT.unpack_from(data)
+            logger.debug("Steps: %s", steps)
             return steps
         except Exception as e:
-            logger.error(f"Failed to read step count: {e}")
+            logger.error("Failed to read step count: %s", e)
             return None
 
     async def read_all_environmental(self) -> EnvironmentalData:
         """Read all environmental sensors at once."""
-        if not self.is_connected:
-            raise ConnectionError("Not connected to a device")
-
-        temp = await self.read_temperature()
-        humidity = await self.read_humidity()
-        pressure = await self.read_pressure()
-        co2, tvoc = await self.read_air_quality()
+        self._require_connected()
+
+        # Each sensor notifies on its own characteristic, so the reads can overlap
+        results = await asyncio.gather(
+            self.read_temperature(),
+            self.read_humidity(),
+            self.read_pressure(),
+            self.read_air_quality(),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error("Failed to read environmental sensor: %s", result)
+        temp, humidity, pressure, air_quality = (
+            None if isinstance(result, Exception) else result for result in results
+        )
+        co2, tvoc = air_quality if air_quality is not None else (None, None)
 
-        return EnvironmentalData(
+        return EnvironmentalData.model_construct(
             temperature=temp, humidity=humidity, pressure=pressure, co2=co2, tvoc=tvoc
         )
 
-    def _rgb_to_color_code(self, red: int, green: int, blue: int) -> int:
-        """
-        Convert RGB values to Nordic Thingy:52 color code.
-
-        Color codes:
-        0x01 = RED, 0x02 = GREEN, 0x03 = YELLOW, 0x04 = BLUE,
-        0x05 = PURPLE, 0x06 = CYAN, 0x07 = WHITE
-
-        Args:
-            red: Red value (0-255)
-            green: Green value (0-255)
-            blue: Blue value (0-255)
-
-        Returns:
-            Color code (1-7)
-        """
-        # Define standard colors as (R, G, B) tuples
-        colors = {
-            0x01: (255, 0, 0),      # RED
-            0x02: (0, 255, 0),      # GREEN
-            0x03: (255, 255, 0),    # YELLOW
-            0x04: (0, 0, 255),      # BLUE
-            0x05: (255, 0, 255),    # PURPLE/MAGENTA
-            0x06: (0, 255, 255),    # CYAN
-            0x07: (255, 255, 255),  # WHITE
-        }
-
-        # Find the closest color using Euclidean distance
-        min_distance = float('inf')
-        closest_code = 0x01
-
-        for code, (r, g, b) in colors.items():
-            distance = ((red - r) ** 2 + (green - g) ** 2 + (blue - b) ** 2) ** 0.5
-            if distance < min_distance:
-                min_distance = distance
-                closest_code = code
-
-        return closest_code
-
     async def set_led(
         self, mode: int, red: int, green: int, blue: int, intensity: int = 100, delay: int = 1000
     ) -> bool:
@@ -821,86 +1551,97 @@ class ThingyBLEClient:
         Returns:
             True if successful
         """
-        if not self.is_connected or self.client is None:
-            raise ConnectionError("Not connected to a device")
+        client = self._require_connected()
 
         try:
-            # Turn off LED first for all modes except off to ensure clean state transition
-            # This prevents color mixing and ensures the new color is displayed correctly
-            # IMPORTANT: OFF command requires write-with-response!
-            if mode in [1, 2, 3]:
-                logger.debug(f"Turning off LED before setting mode {mode}")
-                await self.client.write_gatt_char(LED_UUID, bytes([0x00]), response=True)
-                await asyncio.sleep(0.15)
-
             if mode == 0:
                 # Turn off LED
-                data = bytes([0x00])
+                data = _LED_OFF
             elif mode == 1:
                 # Constant mode: 4 bytes [mode, G, R, B]
                 # NOTE: Nordic Thingy:52 uses GRB byte order, not RGB!
                 # Apply intensity scaling to RGB values
-                r = int(red * intensity / 100)
-                g = int(green * intensity / 100)
-                b = int(blue * intensity / 100)
+                r = red * intensity // 100
+                g = green * intensity // 100
+                b = blue * intensity // 100
                 # Send in GRB order
-                data = bytes([0x01, g, r, b])
-                logger.info(f"LED constant mode: RGB({r},{g},{b}) -> GRB bytes")
-                logger.info(f"LED bytes being sent: {list(data)} = {data.hex()}")
-                logger.info(f"Input values - red:{red}, green:{green}, blue:{blue}, intensity:{intensity}%")
+                data = _LED_CONSTANT_STRUCT.pack(0x01, g, r, b)
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("LED constant mode: RGB(%s,%s,%s) -> GRB bytes", r, g, b)
+                    logger.info("LED bytes being sent: %s = %s", list(data), data.hex())
+                    logger.info("Input values - red:%s, green:%s, blue:%s, intensity:%s%%", red, green, blue, intensity)
             elif mode == 2:
                 # Breathe mode: 5 bytes [mode, color_code, intensity, delay_lsb, delay_msb]
                 # Ensure delay is at least 50ms (Nordic requirement)
                 delay = max(50, delay)
 
                 # Convert RGB to color code
-                color_code = self._rgb_to_color_code(red, green, blue)
+                color_code = _rgb_to_color_code(red, green, blue)
 
                 # Scale intensity to 0-255 range
-                intensity_byte = int(intensity * 255 / 100)
-
-                # Convert delay to little-endian uint16
-                delay_bytes = delay.to_bytes(2, 'little')
+                intensity_byte = _intensity_byte(intensity)
 
-                data = bytes([mode, color_code, intensity_byte, delay_bytes[0], delay_bytes[1]])
+                # Delay is packed as little-endian uint16
+                data = _LED_BREATHE_STRUCT.pack(mode, color_code, intensity_byte, delay)
 
-                color_names = {
-                    0x01: "RED", 0x02: "GREEN", 0x03: "YELLOW", 0x04: "BLUE",
-                    0x05: "PURPLE", 0x06: "CYAN", 0x07: "WHITE"
-                }
-                logger.info(f"LED Breathe mode: {color_names.get(color_code, 'UNKNOWN')} "
-                           f"intensity={intensity}% delay={delay}ms")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("LED Breathe mode: %s intensity=%s%% delay=%sms",
+                               _LED_COLOR_NAMES.get(color_code, 'UNKNOWN'), intensity, delay)
             elif mode == 3:
                 # One-shot mode: 3 bytes [mode, color_code, intensity]
                 # Convert RGB to color code
-                color_code = self._rgb_to_color_code(red, green, blue)
+                color_code = _rgb_to_color_code(red, green, blue)
 
                 # Scale intensity to 0-255 range
-                intensity_byte = int(intensity * 255 / 100)
+                intensity_byte = _intensity_byte(intensity)
 
-                data = bytes([mode, color_code, intensity_byte])
+                data = _LED_ONE_SHOT_STRUCT.pack(mode, color_code, intensity_byte)
 
-                color_names = {
-                    0x01: "RED", 0x02: "GREEN", 0x03: "YELLOW", 0x04: "BLUE",
-                    0x05: "PURPLE", 0x06: "CYAN", 0x07: "WHITE"
-                }
-                logger.info(f"LED One-shot mode: {color_names.get(color_code, 'UNKNOWN')} "
-                           f"intensity={intensity}%")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("LED One-shot mode: %s intensity=%s%%",
+                               _LED_COLOR_NAMES.get(color_code, 'UNKNOWN'), intensity)
             else:
                 raise ValueError(f"Invalid LED mode: {mode}. Must be 0-3.")
 
+            # Nothing to do if the LED already shows this state. One-shot is
+            # never skipped, since repeating it flashes the LED again.
+            if mode != 3 and data == self._last_led:
+                logger.debug("LED already in requested state, skipping write")
+                return True
+
+            # Turn off LED first for all modes except off to ensure clean state transition
+            # This prevents color mixing and ensures the new color is displayed correctly
+            # IMPORTANT: OFF command requires write-with-response!
+            if mode in [1, 2, 3] and self._last_led != _LED_OFF:
+                logger.debug("Turning off LED before setting mode %s", mode)
+                self._last_led = None
+                await client.write_gatt_char(
+                    self._characteristic(LED_UUID), _LED_OFF, response=True
+                )
+                self._last_led = _LED_OFF
+                await asyncio.sleep(0.15)
+
             # Write to LED characteristic
             # IMPORTANT: Constant mode (1) and OFF (0) require write-with-response
             # Breathe (2) and One-shot (3) modes use write-without-response
             use_response = mode in [0, 1]
-            logger.debug(f"Writing LED mode {mode} with response={use_response}")
-            await self.client.write_gatt_char(LED_UUID, data, response=use_response)
-
-            # Small delay after write to ensure it's processed
-            await asyncio.sleep(0.05)
+            logger.debug("Writing LED mode %s with response=%s", mode, use_response)
+            self._last_led = None
+            await client.write_gatt_char(
+                self._characteristic(LED_UUID), data, response=use_response
+            )
+            # The LED returns to its previous state after a one-shot, so the
+            # state is only known for the other modes
+            if mode != 3:
+                self._last_led = data
+
+            # Small delay after write-without-response to ensure it's processed;
+            # acknowledged writes have already been handled by the device
+            if not use_response:
+                await asyncio.sleep(0.05)
             return True
         except Exception as e:
-            logger.error(f"Failed to set LED: {e}")
+            logger.error("Failed to set LED: %s", e)
             return False
 
     async def configure_speaker(self, speaker_mode: int = 0x03, microphone_mode: int = 0x01) -> bool:
@@ -927,8 +1668,7 @@ class ThingyBLEClient:
         Returns:
             True if successful
         """
-        if not self.is_connected or self.client is None:
-            raise ConnectionError("Not connected to a device")
+        client = self._require_connected()
 
         if speaker_mode not in [0x01, 0x02, 0x03]:
             raise ValueError("Speaker mode must be 0x01, 0x02, or 0x03")
@@ -936,6 +1676,11 @@ class ThingyBLEClient:
         if microphone_mode not in [0x01, 0x02]:
             raise ValueError("Microphone mode must be 0x01 or 0x02")
 
+        # The device keeps its sound configuration for the whole connection
+        if self._speaker_config == (speaker_mode, microphone_mode):
+            logger.debug("Sound configuration unchanged, skipping write")
+            return True
+
         try:
             # Nordic Thingy:52 sound configuration format (matches Android app)
             # Byte 0: Speaker mode
@@ -943,15 +1688,22 @@ class ThingyBLEClient:
             # NOTE: Volume is NOT part of configuration! It goes in speaker data for frequency mode.
             config = bytes([speaker_mode, microphone_mode])
 
-            logger.debug(f"Writing sound config: [0x{speaker_mode:02X}, 0x{microphone_mode:02X}] to {SPEAKER_CONFIG_UUID}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Writing sound config: [0x%02X, 0x%02X] to %s",
+                             speaker_mode, microphone_mode, SPEAKER_CONFIG_UUID)
             # Use write-with-response since the characteristic supports it
-            await self.client.write_gatt_char(SPEAKER_CONFIG_UUID, config, response=True)
+            self._speaker_config = None
+            await client.write_gatt_char(
+                self._characteristic(SPEAKER_CONFIG_UUID), config, response=True
+            )
+            self._speaker_config = (speaker_mode, microphone_mode)
             logger.debug("Sound configuration written successfully")
             # Increased delay for better reliability
             await asyncio.sleep(0.2)
             return True
         except Exception as e:
-            logger.error(f"Failed to configure speaker: {e}", exc_info=True)
+            logger.error("Failed to configure speaker: %s", e)
+            logger.debug("Traceback:", exc_info=True)
             return False
 
     async def play_sound(self, sound_id: int) -> bool:
@@ -971,45 +1723,48 @@ class ThingyBLEClient:
         Returns:
             True if successful
         """
-        if not self.is_connected or self.client is None:
-            raise ConnectionError("Not connected to a device")
+        client = self._require_connected()
 
-        if sound_id not in range(1, 9):
+        sample_data = _SOUND_PAYLOADS.get(sound_id)
+        if sample_data is None:
             raise ValueError("Sound ID must be between 1 and 8")
 
         try:
             # Configure speaker to sample mode (0x03) with ADPCM microphone mode (0x01)
             # This matches the Android app implementation
-            logger.info(f"Playing sound sample {sound_id}...")
-            logger.debug(f"Configuring speaker: mode=0x03 (SAMPLE), mic=0x01 (ADPCM)")
+            logger.info("Playing sound sample %s...", sound_id)
+            if self._speaker_config != (0x03, 0x01):
+                logger.debug("Configuring speaker: mode=0x03 (SAMPLE), mic=0x01 (ADPCM)")
 
-            config_success = await self.configure_speaker(speaker_mode=0x03, microphone_mode=0x01)
-            if not config_success:
-                logger.error("Failed to configure speaker for sample mode")
-                return False
+                config_success = await self.configure_speaker(speaker_mode=0x03, microphone_mode=0x01)
+                if not config_success:
+                    logger.error("Failed to configure speaker for sample mode")
+                    return False
 
-            # Delay to ensure configuration is applied (Android app uses queue system)
-            await asyncio.sleep(0.1)
+                # Delay to ensure configuration is applied (Android app uses queue system)
+                await asyncio.sleep(0.1)
 
             # Send the sample ID as a single byte to speaker data characteristic
             # Android app uses WRITE_TYPE_NO_RESPONSE for speaker data
-            sample_data = bytes([sound_id])
-            logger.debug(f"Writing sound sample {sound_id} (0x{sound_id:02X}) to speaker data characteristic")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Writing sound sample %s (0x%02X) to speaker data characteristic", sound_id, sound_id)
 
-            await self.client.write_gatt_char(SPEAKER_DATA_UUID, sample_data, response=False)
+            await client.write_gatt_char(
+                self._characteristic(SPEAKER_DATA_UUID), sample_data, response=False
+            )
 
-            logger.info(f"Sound {sound_id} sent to device successfully")
+            logger.info("Sound %s sent to device successfully", sound_id)
             return True
         except Exception as e:
-            logger.error(f"Failed to play sound {sound_id}: {e}", exc_info=True)
+            logger.error("Failed to play sound %s: %s", sound_id, e)
+            logger.debug("Traceback:", exc_info=True)
             return False
 
     # === Advanced Sensor Methods ===
 
     async def read_quaternion(self) -> Optional[tuple[float, float, float, float]]:
         """Read quaternion orientation data via notification."""
-        if not self.is_connected or self.client is None:
-            raise ConnectionError("Not connected to a device")
+        self._require_connected()
 
         try:
             data = await self._read_via_notification(QUATERNION_UUID, timeout=5.0)
@@ -1020,21 +1775,21 @@ class ThingyBLEClient:
 
             # Quaternion: 4 floats (w, x, y, z), 4 bytes each = 16 bytes total
             # Format: signed 32-bit fixed point with 30 fractional bits
-            w = int.from_bytes(data[0:4], "little", signed=True) / (1 << 30)
-            x = int.from_bytes(data[4:8], "little", signed=True) / (1 << 30)
-            y = int.from_bytes(data[8:12], "little", signed=True) / (1 << 30)
-            z = int.from_bytes(data[12:16], "little", signed=True) / (1 << 30)
+            w, x, y, z = _QUATERNION_STRUCT.unpack_from(data)
+            w *= _Q30_SCALE
+            x *= _Q30_SCALE
+            y *= _Q30_SCALE
+            z *= _Q30_SCALE
 
-            logger.debug(f"Quaternion: w={w}, x={x}, y={y}, z={z}")
+            logger.debug("Quaternion: w=%s, x=%s, y=%s, z=%s", w, x, y, z)
             return (w, x, y, z)
         except Exception as e:
-            logger.error(f"Failed to read quaternion: {e}")
+            logger.error("Failed to read quaternion: %s", e)
             return None
 
     async def read_euler_angles(self) -> Optional[tuple[float, float, float]]:
         """Read Euler angles (roll, pitch, yaw) via notification."""
-        if not self.is_connected or self.client is None:
-            raise ConnectionError("Not connected to a device")
+        self._require_connected()
 
         try:
             data = await self._read_via_notification(EULER_UUID, timeout=5.0)
@@ -1044,20 +1799,20 @@ class ThingyBLEClient:
                 return None
 
             # Euler angles: 3 signed 32-bit integers in degrees * 65536
-            roll = int.from_bytes(data[0:4], "little", signed=True) / 65536.0
-            pitch = int.from_bytes(data[4:8], "little", signed=True) / 65536.0
-            yaw = int.from_bytes(data[8:12], "little", signed=True) / 65536.0
+            roll, pitch, yaw = _EULER_STRUCT.unpack_from(data)
+            roll *= _Q16_SCALE
+            pitch *= _Q16_SCALE
+            yaw *= _Q16_SCALE
 
-            logger.debug(f"Euler angles: roll={roll}°, pitch={pitch}°, yaw={yaw}°")
+            logger.debug("Euler angles: roll=%s°, pitch=%s°, yaw=%s°", roll, pitch, yaw)
             return (roll, pitch, yaw)
         except Exception as e:
-            logger.error(f"Failed to read Euler angles: {e}")
+            logger.error("Failed to read Euler angles: %s", e)
             return None
 
     async def read_heading(self) -> Optional[float]:
         """Read compass heading via notification."""
-        if not self.is_connected or self.client is None:
-            raise ConnectionError("Not connected to a device")
+        self._require_connected()
 
         try:
             data = await self._read_via_notification(HEADING_UUID, timeout=5.0)
@@ -1067,28 +1822,29 @@ class ThingyBLEClient:
                 return None
 
             # Heading: signed 32-bit integer in degrees * 65536
-            heading = int.from_bytes(data[0:4], "little", signed=True) / 65536.0
+            (heading,) = _HEADING_STRUCT.unpack_from(data)
 
-            # Normalize to 0-360
-            heading = heading % 360
-            if heading < 0:
-                heading += 360
+            # Normalize to 0-360 (Python's % already returns a non-negative result)
+            heading = (heading * _Q16_SCALE) % 360.0
 
-            logger.debug(f"Heading: {heading}°")
+            logger.debug("Heading: %s°", heading)
             return heading
         except Exception as e:
-            logger.error(f"Failed to read heading: {e}")
+            logger.error("Failed to read heading: %s", e)
             return None
 
-    async def read_tap_event(self) -> Optional[dict]:
+    async def read_tap_event(self) -> Optional[Mapping[str, object]]:
         """
         Subscribe to tap detection events.
 
         Note: This is an event-based sensor that requires continuous monitoring.
         Use this for event-driven applications.
+
+        Returns:
+            Read-only mapping with the tap type, direction and count (shared
+            between calls, so copy it before modifying), or None on timeout
         """
-        if not self.is_connected or self.client is None:
-            raise ConnectionError("Not connected to a device")
+        self._require_connected()
 
         try:
             data = await self._read_via_notification(TAP_UUID, timeout=10.0)
@@ -1101,31 +1857,23 @@ class ThingyBLEClient:
             direction = data[0]  # 1=X+, 2=X-, 3=Y+, 4=Y-, 5=Z+, 6=Z-
             count = data[1]  # 1=single tap, 2=double tap
 
-            direction_map = {
-                1: "X+", 2: "X-", 3: "Y+", 4: "Y-", 5: "Z+", 6: "Z-"
-            }
-
-            tap_type = "double" if count == 2 else "single"
+            result = _TAP_RESULTS.get((direction, count))
+            if result is None:
+                result = _make_tap_result(direction, count)
 
-            logger.info(f"Tap detected: {tap_type} tap on {direction_map.get(direction, 'unknown')}")
-            return {
-                "type": tap_type,
-                "direction": direction_map.get(direction, "unknown"),
-                "count": count,
-            }
+            logger.info("Tap detected: %s tap on %s", result['type'], result['direction'])
+            return result
         except Exception as e:
-            logger.error(f"Failed to read tap event: {e}")
+            logger.error("Failed to read tap event: %s", e)
             return None
 
     async def read_orientation(self) -> Optional[int]:
         """Read device orientation via notification."""
-        if not self.is_connected or self.client is None:
-            raise ConnectionError("Not connected to a device")
+        self._require_connected()
 
         try:
             # Ensure motion sensors are configured
-            await self.configure_motion_sensors()
-            await asyncio.sleep(0.5)  # Give sensors time to initialize
+            await self._ensure_motion()
 
             data = await self._read_via_notification(ORIENTATION_UUID, timeout=5.0)
 
@@ -1136,28 +1884,23 @@ class ThingyBLEClient:
             # Orientation: 1 byte (0=portrait, 1=landscape, 2=reverse portrait, 3=reverse landscape)
             orientation = data[0]
 
-            orientation_map = {
-                0: "portrait",
-                1: "landscape",
-                2: "reverse_portrait",
-                3: "reverse_landscape",
-            }
-
-            logger.debug(f"Orientation: {orientation_map.get(orientation, 'unknown')}")
+            if logger.isEnabledFor(logging.DEBUG):
+                orientation_name = (
+                    ORIENTATIONS[orientation] if orientation < len(ORIENTATIONS) else "unknown"
+                )
+                logger.debug("Orientation: %s", orientation_name)
             return orientation
         except Exception as e:
-            logger.error(f"Failed to read orientation: {e}")
+            logger.error("Failed to read orientation: %s", e)
             return None
 
     async def read_raw_motion(self) -> Optional[dict]:
         """Read raw accelerometer, gyroscope, and magnetometer data via notification."""
-        if not self.is_connected or self.client is None:
-            raise ConnectionError("Not connected to a device")
+        self._require_connected()
 
         try:
             # Ensure motion sensors are configured
-            await self.configure_motion_sensors()
-            await asyncio.sleep(0.5)  # Give sensors time to initialize
+            await self._ensure_motion()
 
             data = await self._read_via_notification(RAW_DATA_UUID, timeout=5.0)
 
@@ -1166,18 +1909,12 @@ class ThingyBLEClient:
                 return None
 
             # Raw data format: accel (3x2 bytes) + gyro (3x2 bytes) + compass (3x2 bytes)
-            # All values are signed 16-bit integers
-            accel_x = int.from_bytes(data[0:2], "little", signed=True)
-            accel_y = int.from_bytes(data[2:4], "little", signed=True)
-            accel_z = int.from_bytes(data[4:6], "little", signed=True)
-
-            gyro_x = int.from_bytes(data[6:8], "little", signed=True)
-            gyro_y = int.from_bytes(data[8:10], "little", signed=True)
-            gyro_z = int.from_bytes(data[10:12], "little", signed=True)
-
-            compass_x = int.from_bytes(data[12:14], "little", signed=True)
-            compass_y = int.from_bytes(data[14:16], "little", signed=True)
-            compass_z = int.from_bytes(data[16:18], "little", signed=True)
+            # All values are signed 16-bit integers, decoded from the single notification
+            (
+                accel_x, accel_y, accel_z,
+                gyro_x, gyro_y, gyro_z,
+                compass_x, compass_y, compass_z,
+            ) = _RAW_MOTION_STRUCT.unpack_from(data)
 
             return {
                 "accelerometer": {"x": accel_x, "y": accel_y, "z": accel_z},
@@ -1185,5 +1922,5 @@ class ThingyBLEClient:
                 "magnetometer": {"x": compass_x, "y": compass_y, "z": compass_z},
             }
         except Exception as e:
-            logger.error(f"Failed to read raw motion data: {e}")
+            logger.error("Failed to read raw motion data: %s", e)
             return None
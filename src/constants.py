@@ -1,12 +1,22 @@
 """Nordic Thingy:52 Bluetooth LE UUIDs and constants."""
 
 # Service UUIDs
+CONFIGURATION_SERVICE_UUID = "EF680100-9B35-4933-9B10-52FFA9740042"  # Advertised by the Thingy
 ENVIRONMENT_SERVICE_UUID = "EF680200-9B35-4933-9B10-52FFA9740042"
 MOTION_SERVICE_UUID = "EF680400-9B35-4933-9B10-52FFA9740042"
 UI_SERVICE_UUID = "EF680300-9B35-4933-9B10-52FFA9740042"
 SOUND_SERVICE_UUID = "EF680500-9B35-4933-9B10-52FFA9740042"
 BATTERY_SERVICE_UUID = "0000180F-0000-1000-8000-00805F9B34FB"
 
+# Services resolved on connect (GATT discovery is limited to these)
+THINGY_SERVICE_UUIDS = [
+    ENVIRONMENT_SERVICE_UUID,
+    MOTION_SERVICE_UUID,
+    UI_SERVICE_UUID,
+    SOUND_SERVICE_UUID,
+    BATTERY_SERVICE_UUID,
+]
+
 # Environment Characteristic UUIDs
 TEMPERATURE_UUID = "EF680201-9B35-4933-9B10-52FFA9740042"
 PRESSURE_UUID = "EF680202-9B35-4933-9B10-52FFA9740042"
@@ -42,7 +52,13 @@ MICROPHONE_UUID = "EF680504-9B35-4933-9B10-52FFA9740042"      # Microphone data
 BATTERY_LEVEL_UUID = "00002A19-0000-1000-8000-00805F9B34FB"
 
 # Device name patterns
-THINGY_NAME_PATTERNS = ["Thingy", "Nordic"]
+THINGY_NAME_PATTERNS = ("Thingy", "Nordic")
+
+# Tap directions, indexed by the direction byte (1=X+ ... 6=Z-); 0 is not used
+TAP_DIRECTIONS = ("unknown", "X+", "X-", "Y+", "Y-", "Z+", "Z-")
+
+# Orientations, indexed by the orientation byte
+ORIENTATIONS = ("portrait", "landscape", "reverse_portrait", "reverse_landscape")
 
 # LED modes
 LED_MODE_OFF = 0
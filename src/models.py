@@ -1,5 +1,6 @@
-"""Pydantic models for Thingy:52 data structures."""
+"""Data models for Thingy:52 data structures (Pydantic models and plain dataclasses)."""
 
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
@@ -25,13 +26,14 @@ class EnvironmentalData(BaseModel):
     tvoc: Optional[int] = Field(None, description="TVOC in ppb")
 
 
-class ColorData(BaseModel):
-    """Color sensor data."""
+@dataclass(frozen=True, slots=True)
+class ColorData:
+    """Color sensor data (each channel is an unsigned 16-bit value)."""
 
-    red: int = Field(..., ge=0, le=65535)
-    green: int = Field(..., ge=0, le=65535)
-    blue: int = Field(..., ge=0, le=65535)
-    clear: int = Field(..., ge=0, le=65535)
+    red: int
+    green: int
+    blue: int
+    clear: int
 
 
 class MotionData(BaseModel):
@@ -42,7 +44,8 @@ class MotionData(BaseModel):
     orientation: Optional[str] = Field(None, description="Device orientation")
 
 
-class QuaternionData(BaseModel):
+@dataclass(frozen=True, slots=True)
+class QuaternionData:
     """Quaternion rotation representation."""
 
     w: float
@@ -51,12 +54,13 @@ class QuaternionData(BaseModel):
     z: float
 
 
-class EulerData(BaseModel):
-    """Euler angles (roll, pitch, yaw)."""
+@dataclass(frozen=True, slots=True)
+class EulerData:
+    """Euler angles (roll, pitch, yaw) in degrees."""
 
-    roll: float = Field(..., description="Roll in degrees")
-    pitch: float = Field(..., description="Pitch in degrees")
-    yaw: float = Field(..., description="Yaw in degrees")
+    roll: float
+    pitch: float
+    yaw: float
 
 
 class LEDConfig(BaseModel):
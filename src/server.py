@@ -1,5 +1,6 @@
 """Nordic Thingy:52 MCP Server using FastMCP."""
 
+import asyncio
 import logging
 import sys
 from typing import List, Optional, Union
@@ -7,7 +8,7 @@ from typing import List, Optional, Union
 from mcp.server.fastmcp import FastMCP
 
 from .bluetooth_client import ThingyBLEClient
-from .constants import LED_COLORS, LED_MODE_BREATHE, LED_MODE_CONSTANT, LED_MODE_OFF
+from .constants import LED_COLORS, LED_MODE_BREATHE, LED_MODE_CONSTANT, LED_MODE_OFF, ORIENTATIONS
 from .models import ConnectionStatus, DeviceInfo, EnvironmentalData
 
 # Configure logging with more visible format
@@ -40,37 +41,47 @@ logger.info("Registering device management tools...")
 
 
 @mcp.tool()
-async def scan_devices(timeout: Union[int, float] = 10.0) -> List[DeviceInfo]:
+async def scan_devices(
+    timeout: Union[int, float] = 10.0, max_devices: int = 0
+) -> List[DeviceInfo]:
     """
     Scan for nearby Nordic Thingy:52 devices.
 
     Args:
-        timeout: Scan duration in seconds (default: 10.0, accepts both int and float)
+        timeout: Maximum scan duration in seconds (default: 10.0, accepts both int and float)
+        max_devices: Stop as soon as this many devices are found (default: 0 = scan full timeout)
 
     Returns:
         List of discovered Thingy devices with their addresses, names, and signal strength
     """
     # Convert timeout to float to ensure compatibility
     timeout_float = float(timeout)
-    logger.info(f"Scanning for Thingy devices with timeout={timeout_float}s")
-    devices = await ble_client.scan(timeout=timeout_float)
-    logger.info(f"Found {len(devices)} Thingy device(s)")
+    logger.info("Scanning for Thingy devices with timeout=%ss", timeout_float)
+    devices = await ble_client.scan(timeout=timeout_float, max_devices=max_devices)
+    logger.info("Found %s Thingy device(s)", len(devices))
     return devices
 
 
 @mcp.tool()
-async def connect_device(address: str, timeout: float = 30.0) -> dict[str, str]:
+async def connect_device(address: Optional[str] = None, timeout: float = 30.0) -> dict[str, str]:
     """
     Connect to a Nordic Thingy:52 device.
 
     Args:
-        address: Bluetooth MAC address of the device (e.g., "AA:BB:CC:DD:EE:FF")
+        address: Bluetooth MAC address of the device (e.g., "AA:BB:CC:DD:EE:FF").
+            If omitted, connects to the first Thingy found advertising nearby.
         timeout: Connection timeout in seconds (default: 30.0)
 
     Returns:
         Connection status message
     """
-    logger.info(f"Attempting to connect to {address}")
+    if address is None:
+        device = await ble_client.find_device()
+        if device is None:
+            return {"status": "error", "message": "No Thingy device found nearby"}
+        address = device.address
+
+    logger.info("Attempting to connect to %s", address)
     success = await ble_client.connect(address, timeout=timeout)
 
     if success:
@@ -104,7 +115,7 @@ async def get_device_status() -> dict:
     Returns:
         Connection status including battery level, reconnection state, and retry count
     """
-    if not ble_client.is_connected:
+    if not ble_client.verify_connected():
         return {
             "connected": False,
             "connection_state": ble_client.connection_state,
@@ -117,7 +128,7 @@ async def get_device_status() -> dict:
     try:
         battery = await ble_client.read_battery()
     except Exception as e:
-        logger.warning(f"Could not read battery: {e}")
+        logger.warning("Could not read battery: %s", e)
         battery = None
 
     return {
@@ -370,16 +381,9 @@ async def read_orientation() -> dict:
     """
     orientation = await ble_client.read_orientation()
 
-    orientation_map = {
-        0: "portrait",
-        1: "landscape",
-        2: "reverse_portrait",
-        3: "reverse_landscape",
-    }
-
     orientation_name = "unknown"
-    if orientation is not None:
-        orientation_name = orientation_map.get(orientation, "unknown")
+    if orientation is not None and orientation < len(ORIENTATIONS):
+        orientation_name = ORIENTATIONS[orientation]
 
     return {
         "orientation": orientation_name,
@@ -596,7 +600,7 @@ The Nordic Thingy:52 is a compact IoT prototyping platform with multiple sensors
 )
 async def get_connection_status() -> str:
     """Get current connection status and device information."""
-    if not ble_client.is_connected:
+    if not ble_client.verify_connected():
         return """# Connection Status
 
 **Status**: Not Connected
@@ -1098,6 +1102,27 @@ def _assess_air_quality(co2: Optional[int]) -> str:
         return "bad"
 
 
+def install_uvloop() -> bool:
+    """
+    Use uvloop for the server's event loop if it is installed.
+
+    uvloop is an optional speedup (``pip install thingy52-mcp[speedups]``) that
+    lowers the per-callback cost of notification delivery. Must be called
+    before the event loop is created.
+
+    Returns:
+        True if uvloop was installed
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.info("Using uvloop event loop")
+    return True
+
+
 def main():
     """Main entry point for the MCP server."""
     logger.info("=" * 70)
@@ -1131,6 +1156,8 @@ def main():
     logger.info("Press Ctrl+C to stop the server")
     logger.info("=" * 70)
 
+    install_uvloop()
+
     try:
         # Run the FastMCP server
         mcp.run()
@@ -1143,7 +1170,7 @@ def main():
         sys.exit(0)
     except Exception as e:
         logger.error("=" * 70)
-        logger.error(f"Server error: {e}")
+        logger.error("Server error: %s", e)
         logger.error("=" * 70)
         sys.exit(1)
 
@@ -0,0 +1,461 @@
+"""Offline unit tests for ThingyBLEClient payload handling."""
+
+import asyncio
+import struct
+import time
+
+import pytest
+
+from conftest import advertisement
+from src.bluetooth_client import ThingyBLEClient, _rgb_to_color_code
+from src.constants import (
+    AIR_QUALITY_UUID,
+    COLOR_UUID,
+    CONFIGURATION_SERVICE_UUID,
+    ENVIRONMENT_CONFIG_UUID,
+    HUMIDITY_UUID,
+    LED_UUID,
+    PRESSURE_UUID,
+    QUATERNION_UUID,
+    RAW_DATA_UUID,
+    STEP_COUNTER_UUID,
+    TEMPERATURE_UUID,
+)
+
+
+# === Sensor payload decoding ===
+
+
+@pytest.mark.parametrize(
+    "payload, expected",
+    [
+        (bytes([21, 50]), 21.5),
+        (bytes([0, 0]), 0.0),
+        # Signed integer part, unsigned hundredths: -3 + 0.05
+        (bytes([0xFD, 5]), -2.95),
+    ],
+)
+async def test_read_temperature(client, fake_bleak, payload, expected):
+    fake_bleak.payloads[TEMPERATURE_UUID] = payload
+    assert await client.read_temperature() == pytest.approx(expected)
+
+
+async def test_read_humidity(client, fake_bleak):
+    fake_bleak.payloads[HUMIDITY_UUID] = bytes([40])
+    assert await client.read_humidity() == 40.0
+
+
+async def test_read_pressure(client, fake_bleak):
+    fake_bleak.payloads[PRESSURE_UUID] = struct.pack("<iB", 1013, 25)
+    assert await client.read_pressure() == pytest.approx(1013.25)
+
+
+async def test_read_color(client, fake_bleak):
+    fake_bleak.payloads[COLOR_UUID] = struct.pack("<4H", 1, 2, 3, 400)
+    color = await client.read_color()
+    assert (color.red, color.green, color.blue, color.clear) == (1, 2, 3, 400)
+    assert await client.read_light_intensity() == 400
+
+
+async def test_read_step_count(client, fake_bleak):
+    # Step count (uint32) is followed by a time field that is ignored
+    fake_bleak.payloads[STEP_COUNTER_UUID] = struct.pack("<II", 42, 1000)
+    assert await client.read_step_count() == 42
+
+
+# === Payload length validation ===
+
+
+@pytest.mark.parametrize(
+    "uuid, payload, read",
+    [
+        (TEMPERATURE_UUID, bytes([21]), "read_temperature"),
+        (HUMIDITY_UUID, b"", "read_humidity"),
+        (PRESSURE_UUID, struct.pack("<i", 1013), "read_pressure"),
+        (COLOR_UUID, struct.pack("<3H", 1, 2, 3), "read_color"),
+        (RAW_DATA_UUID, struct.pack("<8h", *range(8)), "read_raw_motion"),
+        (QUATERNION_UUID, struct.pack("<3i", 0, 0, 0), "read_quaternion"),
+    ],
+)
+async def test_short_payload_is_rejected(client, fake_bleak, uuid, payload, read):
+    fake_bleak.payloads[uuid] = payload
+    assert await getattr(client, read)() is None
+
+
+async def test_long_payload_is_accepted(client, fake_bleak):
+    # Trailing bytes beyond the decoded layout are ignored
+    fake_bleak.payloads[TEMPERATURE_UUID] = bytes([21, 50, 0xFF])
+    assert await client.read_temperature() == pytest.approx(21.5)
+
+
+# === Notification dispatch ===
+
+
+async def test_failing_consumer_does_not_block_reads(client, fake_bleak):
+    def broken(data):
+        raise ValueError("consumer bug")
+
+    client._dispatcher.add(TEMPERATURE_UUID, broken)
+    fake_bleak.payloads[TEMPERATURE_UUID] = bytes([21, 50])
+    assert await client.read_temperature() == pytest.approx(21.5)
+
+
+
+async def test_stream_notifications_yields_payloads(client, fake_bleak):
+    fake_bleak.payloads[TEMPERATURE_UUID] = bytes([21, 50])
+    stream = client.stream_notifications(TEMPERATURE_UUID)
+    try:
+        assert await asyncio.wait_for(stream.__anext__(), 1.0) == bytes([21, 50])
+    finally:
+        await stream.aclose()
+
+
+async def test_stream_notifications_ends_on_disconnect(client, fake_bleak):
+    received = []
+
+    async def consume():
+        async for data in client.stream_notifications(TEMPERATURE_UUID):
+            received.append(data)
+            client.client.drop()
+
+    fake_bleak.payloads[TEMPERATURE_UUID] = bytes([21, 50])
+    with pytest.raises(ConnectionError):
+        await asyncio.wait_for(consume(), 1.0)
+    assert received == [bytes([21, 50])]
+
+
+async def test_pending_read_fails_fast_on_disconnect(client, fake_bleak):
+    # No payload configured, so the read waits until the link drops
+    read = asyncio.create_task(client.read_temperature())
+    await asyncio.sleep(0.05)
+    start = time.monotonic()
+    client.client.drop()
+    assert await read is None
+    assert time.monotonic() - start < 1.0
+
+
+# === Environment configuration ===
+
+
+def _env_config(temp, pressure, humidity, color, gas_mode):
+    return struct.pack("<4HB", temp, pressure, humidity, color, gas_mode)
+
+
+async def test_concurrent_environment_configs_merge_into_one_write(client, fake_bleak):
+    calibration = b"\x07"
+    config = _env_config(1000, 1000, 1000, 1000, 2) + calibration
+    fake_bleak.gatt_reads[ENVIRONMENT_CONFIG_UUID] = config
+    results = await asyncio.gather(
+        client.configure_environment_sensors(temp_interval_ms=500),
+        client.configure_environment_sensors(gas_mode=1),
+    )
+    assert results == [True, True]
+    # Both changes land in a single write; the trailing calibration byte is kept
+    assert client.client.writes_to(ENVIRONMENT_CONFIG_UUID) == [
+        _env_config(500, 1000, 1000, 1000, 1) + calibration
+    ]
+
+
+async def test_unchanged_environment_config_is_not_rewritten(client, fake_bleak):
+    fake_bleak.gatt_reads[ENVIRONMENT_CONFIG_UUID] = _env_config(1000, 1000, 1000, 1000, 2)
+    assert await client.configure_environment_sensors(gas_mode=1)
+    assert await client.configure_environment_sensors(gas_mode=1)
+    assert len(client.client.writes_to(ENVIRONMENT_CONFIG_UUID)) == 1
+
+
+async def test_pending_environment_config_is_dropped_on_reconnect(client, fake_bleak):
+    fake_bleak.gatt_reads[ENVIRONMENT_CONFIG_UUID] = _env_config(1000, 1000, 1000, 1000, 2)
+    old = client.client
+    pending = asyncio.create_task(client.configure_environment_sensors(gas_mode=1))
+    await asyncio.sleep(0)
+    # The link drops and comes back inside the coalescing window
+    old.drop()
+    assert await client.connect(old.address)
+    assert await client.configure_environment_sensors(gas_mode=3)
+    assert client.client.writes_to(ENVIRONMENT_CONFIG_UUID) == [
+        _env_config(1000, 1000, 1000, 1000, 3)
+    ]
+    assert await pending is False
+    assert old.writes_to(ENVIRONMENT_CONFIG_UUID) == []
+
+
+# === Environmental stream ===
+
+
+def _feed_environment(fake_bleak, temperature=bytes([21, 50])):
+    fake_bleak.payloads.update({
+        TEMPERATURE_UUID: temperature,
+        HUMIDITY_UUID: bytes([40]),
+        PRESSURE_UUID: struct.pack("<iB", 1013, 25),
+        AIR_QUALITY_UUID: struct.pack("<HH", 450, 12),
+    })
+
+
+async def test_environmental_stream_combines_readings(client, fake_bleak):
+    _feed_environment(fake_bleak)
+    readings = []
+    stop = await client.start_environmental_stream(readings.append)
+    await asyncio.sleep(0.1)
+    stop()
+    count = len(readings)
+    await asyncio.sleep(0.05)
+
+    assert count > 0
+    assert len(readings) == count
+    reading = readings[0]
+    assert reading.temperature == pytest.approx(21.5)
+    assert reading.humidity == 40.0
+    assert reading.pressure == pytest.approx(1013.25)
+    assert (reading.co2, reading.tvoc) == (450, 12)
+
+
+async def test_environmental_stream_skips_short_payloads(client, fake_bleak):
+    _feed_environment(fake_bleak, temperature=bytes([21]))
+    readings = []
+    stop = await client.start_environmental_stream(readings.append)
+    await asyncio.sleep(0.1)
+    stop()
+    assert readings == []
+
+
+async def test_environmental_stream_survives_failing_callback(client, fake_bleak):
+    _feed_environment(fake_bleak)
+    calls = []
+
+    def callback(reading):
+        calls.append(reading)
+        raise RuntimeError("callback bug")
+
+    stop = await client.start_environmental_stream(callback)
+    await asyncio.sleep(0.1)
+    stop()
+    assert len(calls) > 1
+
+
+async def test_environmental_stream_reports_disconnect(client, fake_bleak):
+    _feed_environment(fake_bleak)
+    closed = []
+    await client.start_environmental_stream(
+        lambda reading: None, on_closed=lambda: closed.append(True)
+    )
+    await asyncio.sleep(0.05)
+    client.client.drop()
+    assert closed == [True]
+
+
+async def test_environmental_stream_stop_is_not_reported_as_closed(client, fake_bleak):
+    _feed_environment(fake_bleak)
+    closed = []
+    stop = await client.start_environmental_stream(
+        lambda reading: None, on_closed=lambda: closed.append(True)
+    )
+    stop()
+    client.client.drop()
+    assert closed == []
+
+
+# === LED encoding ===
+
+
+@pytest.mark.parametrize(
+    "rgb, code",
+    [
+        ((255, 0, 0), 0x01),
+        ((0, 255, 0), 0x02),
+        ((255, 255, 0), 0x03),
+        ((0, 0, 255), 0x04),
+        ((255, 0, 255), 0x05),
+        ((0, 255, 255), 0x06),
+        ((255, 255, 255), 0x07),
+        # Non-palette colors map to the nearest palette entry
+        ((250, 10, 10), 0x01),
+        ((128, 0, 128), 0x05),
+        ((0, 0, 0), 0x01),
+    ],
+)
+def test_rgb_to_color_code(rgb, code):
+    assert _rgb_to_color_code(*rgb) == code
+
+
+@pytest.mark.parametrize(
+    "args, frame",
+    [
+        # Constant: mode, green, red, blue, each scaled by intensity
+        ((1, 255, 128, 0, 50), "01407f00"),
+        # Breathe: mode, color code, intensity byte, delay (uint16, at least 50 ms)
+        ((2, 250, 0, 0, 80, 20), "0201cc3200"),
+        ((2, 0, 0, 255, 100, 1000), "0204ffe803"),
+        # One-shot: mode, color code, intensity byte
+        ((3, 0, 0, 255), "0304ff"),
+    ],
+)
+async def test_set_led_frames(client, args, frame):
+    assert await client.set_led(*args)
+    assert client.client.writes_to(LED_UUID)[-1].hex() == frame
+
+
+async def test_set_led_skips_unchanged_state(client):
+    await client.set_led(1, 255, 0, 0)
+    writes = len(client.client.writes_to(LED_UUID))
+    await client.set_led(1, 255, 0, 0)
+    assert len(client.client.writes_to(LED_UUID)) == writes
+
+
+async def test_set_led_rejects_out_of_range_intensity(client):
+    assert not await client.set_led(2, 255, 0, 0, intensity=101)
+
+
+# === Scanning ===
+
+
+async def test_scan_finds_thingys_by_service_uuid_or_name(fake_scanner):
+    fake_scanner.advertisements = [
+        advertisement("AA:BB:CC:DD:EE:01", "Thingy"),
+        advertisement("AA:BB:CC:DD:EE:02", "Renamed", [CONFIGURATION_SERVICE_UUID.lower()]),
+        advertisement("AA:BB:CC:DD:EE:03", "Phone"),
+    ]
+    ble = ThingyBLEClient(auto_reconnect=False)
+
+    devices = await ble.scan(timeout=0.05)
+
+    assert sorted(device.address for device in devices) == [
+        "AA:BB:CC:DD:EE:01",
+        "AA:BB:CC:DD:EE:02",
+    ]
+    # Advertisements are filtered by _is_thingy, not by the OS
+    assert "service_uuids" not in fake_scanner.instances[0].kwargs
+
+
+async def test_scan_discards_scanner_after_failed_start(fake_scanner):
+    fake_scanner.advertisements = [advertisement("AA:BB:CC:DD:EE:01", "Thingy")]
+    fake_scanner.failing_starts = 1
+    ble = ThingyBLEClient(auto_reconnect=False)
+
+    assert await ble.scan(timeout=0.05) == []
+    devices = await ble.scan(timeout=0.05)
+
+    assert [device.address for device in devices] == ["AA:BB:CC:DD:EE:01"]
+    assert len(fake_scanner.instances) == 2
+
+
+async def test_scan_reuses_working_scanner(fake_scanner):
+    fake_scanner.advertisements = [advertisement("AA:BB:CC:DD:EE:01", "Thingy")]
+    ble = ThingyBLEClient(auto_reconnect=False)
+
+    await ble.scan(timeout=0.05)
+    await ble.scan(timeout=0.05)
+
+    assert len(fake_scanner.instances) == 1
+
+
+async def test_find_device_matches_by_service_uuid_or_name(fake_scanner):
+    ble = ThingyBLEClient(auto_reconnect=False)
+
+    fake_scanner.advertisements = [
+        advertisement("AA:BB:CC:DD:EE:03", "Phone"),
+        advertisement("AA:BB:CC:DD:EE:02", "Renamed", [CONFIGURATION_SERVICE_UUID.lower()]),
+    ]
+    device = await ble.find_device(timeout=0.05)
+    assert device.address == "AA:BB:CC:DD:EE:02"
+    assert device.name == "Renamed"
+
+    fake_scanner.advertisements = [advertisement("AA:BB:CC:DD:EE:01", "Thingy")]
+    device = await ble.find_device(timeout=0.05)
+    assert device.address == "AA:BB:CC:DD:EE:01"
+
+
+async def test_find_device_returns_none_on_timeout(fake_scanner):
+    fake_scanner.advertisements = [advertisement("AA:BB:CC:DD:EE:03", "Phone")]
+    ble = ThingyBLEClient(auto_reconnect=False)
+
+    assert await ble.find_device(timeout=0.05) is None
+
+
+async def test_find_device_keeps_earlier_scan_results(fake_scanner):
+    fake_scanner.advertisements = [advertisement("AA:BB:CC:DD:EE:01", "Thingy")]
+    ble = ThingyBLEClient(auto_reconnect=False)
+    await ble.scan(timeout=0.05)
+
+    fake_scanner.advertisements = [advertisement("AA:BB:CC:DD:EE:02", "Thingy")]
+    await ble.find_device(timeout=0.05)
+
+    assert ble._scanned_device("aa:bb:cc:dd:ee:01").address == "AA:BB:CC:DD:EE:01"
+    assert ble._scanned_device("AA:BB:CC:DD:EE:02").address == "AA:BB:CC:DD:EE:02"
+
+
+async def test_find_device_waits_for_running_scan(fake_scanner):
+    fake_scanner.advertisements = [advertisement("AA:BB:CC:DD:EE:01", "Thingy")]
+    ble = ThingyBLEClient(auto_reconnect=False)
+
+    devices, device = await asyncio.gather(ble.scan(timeout=0.05), ble.find_device(timeout=0.05))
+
+    assert [d.address for d in devices] == ["AA:BB:CC:DD:EE:01"]
+    assert device.address == "AA:BB:CC:DD:EE:01"
+
+
+async def test_connect_device_without_address_uses_found_device(
+    fake_scanner, fake_bleak, monkeypatch
+):
+    import src.server as server
+
+    fake_scanner.advertisements = [advertisement("AA:BB:CC:DD:EE:01", "Thingy")]
+    ble = ThingyBLEClient(auto_reconnect=False)
+    monkeypatch.setattr(server, "ble_client", ble)
+
+    result = await server.connect_device()
+
+    assert result == {"status": "success", "message": "Connected to AA:BB:CC:DD:EE:01"}
+    assert fake_bleak.instances[-1].address == "AA:BB:CC:DD:EE:01"
+    await ble.disconnect()
+
+
+# === Auto-reconnect ===
+
+
+def _flaky_client_factory(fake_bleak, failures):
+    """BleakClient replacement whose first `failures` constructions raise."""
+    remaining = [failures]
+
+    def factory(*args, **kwargs):
+        if remaining[0]:
+            remaining[0] -= 1
+            raise OSError("No Bluetooth adapters found")
+        return fake_bleak(*args, **kwargs)
+
+    return factory
+
+
+async def test_reconnect_retries_when_client_construction_fails(client, fake_bleak, monkeypatch):
+    client.auto_reconnect = True
+    client.initial_retry_delay = 0.01
+    monkeypatch.setattr(
+        "src.bluetooth_client.BleakClient", _flaky_client_factory(fake_bleak, failures=1)
+    )
+
+    fake_bleak.instances[0].drop()
+    await client._reconnect_task
+
+    assert client.is_connected
+    assert not client.is_reconnecting
+    assert client.client is fake_bleak.instances[-1]
+
+
+async def test_reconnect_flag_is_cleared_when_construction_keeps_failing(
+    client, fake_bleak, monkeypatch
+):
+    client.auto_reconnect = True
+    client.initial_retry_delay = 0.01
+    client.max_reconnect_attempts = 2
+    monkeypatch.setattr(
+        "src.bluetooth_client.BleakClient", _flaky_client_factory(fake_bleak, failures=2)
+    )
+
+    fake_bleak.instances[0].drop()
+    await client._reconnect_task
+
+    assert not client.is_reconnecting
+    assert client._reconnect_task is None
+    # A later disconnect still starts a new reconnect loop
+    client._on_disconnect(client.client)
+    await client._reconnect_task
+    assert client.is_connected
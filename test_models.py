@@ -0,0 +1,24 @@
+"""Unit tests for the data models returned by the MCP tools."""
+
+from datetime import datetime
+
+from src.models import EnvironmentalData, MotionData
+
+
+def test_environmental_data_output_keys():
+    data = EnvironmentalData(temperature=21.5, humidity=40.0, pressure=1013.25, co2=450, tvoc=12)
+    assert list(data.model_dump()) == [
+        "timestamp", "temperature", "humidity", "pressure", "co2", "tvoc"
+    ]
+    assert isinstance(data.timestamp, datetime)
+
+
+def test_explicit_timestamp_is_kept():
+    stamp = datetime(2024, 1, 2, 3, 4, 5)
+    assert EnvironmentalData(timestamp=stamp).timestamp == stamp
+    assert MotionData(timestamp=stamp, steps=3).timestamp == stamp
+
+
+def test_model_construct_fills_in_timestamp():
+    data = EnvironmentalData.model_construct(temperature=21.5)
+    assert isinstance(data.timestamp, datetime)